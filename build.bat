@@ -9,7 +9,9 @@ IF /I "%PYTEST_CHOSEN%" NEQ "N" GOTO TEST
 GOTO BUILD
 
 :TEST
-pytest --cov
+REM loadgroup spreads tests across workers but keeps each xdist_group
+REM (e.g. the tests sharing the cached ball socket parts) on one worker
+pytest --cov -n auto --dist=loadgroup --run-slow --run-smoke --validate-shapes tests/
 
 SET /P PYTEST_CLEAN=Based on the pytest results, proceed with the build? ([Y]/N)?
 IF /I "%PYTEST_CLEAN%" NEQ "N" GOTO BUILD
@@ -11,7 +11,9 @@ PYPI_WAIT_TIME=30
 read -p "Do you want to run pytest --cov ([Y]/N)? " PYTEST_CHOSEN
 PYTEST_CHOSEN=${PYTEST_CHOSEN:-Y}
 if [[ "$PYTEST_CHOSEN" =~ ^[Yy]$ ]]; then
-    pytest --cov
+    # loadgroup spreads tests across workers but keeps each xdist_group
+    # (e.g. the tests sharing the cached ball socket parts) on one worker
+    pytest --cov -n auto --dist=loadgroup --run-slow --run-smoke --validate-shapes tests/
     read -p "Based on the pytest results, proceed with the build? ([Y]/N)? " PYTEST_CLEAN
     PYTEST_CLEAN=${PYTEST_CLEAN:-Y}
     if [[ ! "$PYTEST_CLEAN" =~ ^[Yy]$ ]]; then
@@ -12,7 +12,6 @@ from build123d import (
     fillet,
 )
 from math import atan, degrees
-from ocp_vscode import show, Camera
 
 
 def anti_chamfer(
@@ -53,6 +52,8 @@ def anti_chamfer(
 
 
 if __name__ == "__main__":
+    from ocp_vscode import show, Camera
+
     with BuildPart(Location((33, 11, 0))) as bkt:
         Box(
             60,
@@ -15,7 +15,6 @@ from build123d import (
     fillet,
     Axis,
 )
-from ocp_vscode import show, Camera
 from math import sqrt
 
 
@@ -149,6 +148,8 @@ def ball_socket(
 
 
 if __name__ == "__main__":
+    from ocp_vscode import show, Camera
+
     show(
         ball_mount(
             24.24871131,
@@ -36,7 +36,6 @@ from build123d import (
     scale,
     sweep,
 )
-from ocp_vscode import Camera, show
 
 
 def radius_to_apothem(radius: float, side_count: int = 6) -> float:
@@ -431,6 +430,7 @@ def teardrop_cylinder(
 
 
 if __name__ == "__main__":
+    from ocp_vscode import Camera, show
 
     show(
         polygonal_cylinder(10, 11, 6, align=(Align.MIN, Align.MIN, Align.CENTER)),
@@ -16,8 +16,6 @@ from build123d import (
     loft,
 )
 
-from ocp_vscode import show, Camera
-
 
 def divot(
     radius: float = 0.5, positive: bool = True, extend_base=False
@@ -52,6 +50,8 @@ def divot(
 
 
 if __name__ == "__main__":
+    from ocp_vscode import show, Camera
+
     show(
         divot(10, extend_base=True),
         divot(10, positive=False),
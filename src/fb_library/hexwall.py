@@ -25,7 +25,6 @@ from build123d import (
     RegularPolygon,
     extrude,
 )
-from ocp_vscode import Camera, show
 
 
 def HexWall(
@@ -83,6 +82,8 @@ def HexWall(
 
 
 if __name__ == "__main__":
+    from ocp_vscode import Camera, show
+
     show(
         HexWall(
             width=200,
@@ -20,7 +20,6 @@ from build123d import (
 )
 from dataclasses import field
 from fb_library import diamond_cylinder, divot, Point, opposite_length, midpoint
-from ocp_vscode import show, Camera
 
 
 def _slide_top_rail_cut(
@@ -483,6 +482,8 @@ def high_top_slide_box(
 
 
 if __name__ == "__main__":
+    from ocp_vscode import show, Camera
+
     with BuildPart() as base_box:
         Box(44, 44, 44, align=(Align.CENTER, Align.CENTER, Align.MIN))
         fillet(base_box.part.edges().filter_by(Axis.Z), radius=1.5)
@@ -4,15 +4,33 @@ Also has some utility functions for calculating various useful properties of poi
 """
 
 from dataclasses import dataclass
-from math import atan2, cos, degrees, radians, sin, tan
-from typing import Union, Tuple
+from functools import lru_cache
+from math import atan2, cos, degrees, hypot, radians, sin, tan
+from typing import Iterable, Sequence, Tuple, overload
 from build123d import Axis
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _cos_sin(angle: float) -> tuple[float, float]:
+    """the cosine and sine of an angle given in degrees; build scripts tend to
+    reuse a handful of angles, so the results are cached
+    ----------
+    Arguments:
+        - angle: float
+            The angle in degrees
+    Returns:
+        - tuple[float, float]: The cosine and sine of the angle"""
+    angle_rad = radians(angle)
+    return cos(angle_rad), sin(angle_rad)
+
+
+# dovetail construction creates and reads a great many points; slots keep
+# each one small and make the coordinate lookups direct
+@dataclass(frozen=True, slots=True)
 class Point:
     """
-    A 2D point with x and y coordinates.
+    A 2D point with x and y coordinates. Points are immutable and hashable;
+    the related_point methods and midpoint functions return new points.
     """
 
     x: float
@@ -34,19 +52,42 @@ class Point:
             - float: The y coordinate of the point"""
         return self.y
 
-    def __init__(self, x: Union[float, list[float, float]] = None, y: float = None):
-        """initialize the point with x and y coordinates passed as a tuple or individual values
+    @overload
+    def __init__(self, x: float, y: float): ...
+
+    @overload
+    def __init__(self, x: Sequence[float]): ...
+
+    def __init__(self, x, y=None):
+        """initialize the point with x and y coordinates passed as a sequence or individual values
         ----------
         Arguments:
-            - x: Union[float, list[float, float]]
-                The x coordinate or a list containing [x, y] coordinates
+            - x: float | Sequence[float]
+                The x coordinate or a sequence containing [x, y] coordinates
             - y: float
-                The y coordinate (ignored if x is a list)"""
-        if isinstance(x, list) and len(x) >= 2:
-            self.x, self.y = x
-        else:
-            self.x = x
-            self.y = y
+                The y coordinate (omitted if x is a sequence)"""
+        if y is None:
+            x, y = x
+        # the dataclass is frozen, so the slots are filled in directly
+        _set_x(self, x)
+        _set_y(self, y)
+
+    def __reduce__(self):
+        """copy and pickle a point by its coordinates, as the frozen slots
+        can't be restored by attribute assignment"""
+        return Point, (self.x, self.y)
+
+    @classmethod
+    def from_iterable(cls, coordinates: Iterable[float]) -> "Point":
+        """create a point from an iterable of [x, y] coordinates
+        ----------
+        Arguments:
+            - coordinates: Iterable[float]
+                An iterable yielding exactly the x and y coordinates
+        Returns:
+            - Point: A new point at the given coordinates"""
+        x, y = coordinates
+        return cls(x, y)
 
     def __iter__(self):
         """iterate through the x and y coordinates of the point
@@ -79,7 +120,17 @@ class Point:
                 The target point to calculate angle to
         Returns:
             - float: The angle in degrees (0-360) from this point to the target point"""
-        return degrees(atan2(point.y - self.y, point.x - self.x)) % 360
+        return degrees(self.angle_to_rad(point)) % 360
+
+    def angle_to_rad(self, point: "Point") -> float:
+        """from the point, identify the signed angle in radians to a second point
+        ----------
+        Arguments:
+            - point: Point
+                The target point to calculate angle to
+        Returns:
+            - float: The angle in radians (-pi to pi) to the target point"""
+        return atan2(point.y - self.y, point.x - self.x)
 
     def distance_to(self, point: "Point") -> float:
         """from the point, identify the distance to a second point
@@ -89,7 +140,7 @@ class Point:
                 The target point to calculate distance to
         Returns:
             - float: The Euclidean distance between the two points"""
-        return ((self.x - point.x) ** 2 + (self.y - point.y) ** 2) ** 0.5
+        return hypot(self.x - point.x, self.y - point.y)
 
     def related_point(self, angle: float, distance: float) -> "Point":
         """from the point, identify a second point at a specified angle and distance
@@ -101,12 +152,32 @@ class Point:
                 The distance from this point to the new point
         Returns:
             - Point: A new point at the specified angle and distance"""
-        angle_rad = radians(angle)
+        cos_angle, sin_angle = _cos_sin(angle)
         return Point(
-            self.x + distance * cos(angle_rad),
-            self.y + distance * sin(angle_rad),
+            self.x + distance * cos_angle,
+            self.y + distance * sin_angle,
         )
 
+    def related_points(
+        self, angles: Iterable[float], distances: Iterable[float]
+    ) -> list["Point"]:
+        """from the point, identify a series of points, each at the paired
+        angle and distance; equivalent to calling related_point for each pair
+        ----------
+        Arguments:
+            - angles: Iterable[float]
+                The angles in degrees from this point (0° = positive x direction)
+            - distances: Iterable[float]
+                The distance from this point to each new point
+        Returns:
+            - list[Point]: A new point for each angle and distance pair"""
+        x, y = self.x, self.y
+        points = []
+        for angle, distance in zip(angles, distances):
+            cos_angle, sin_angle = _cos_sin(angle)
+            points.append(Point(x + distance * cos_angle, y + distance * sin_angle))
+        return points
+
     def related_point_by_axis(
         self, angle: float, axis_distance: float, axis: Axis = Axis.X
     ) -> "Point":
@@ -121,40 +192,44 @@ class Point:
                 Either Axis.X or Axis.Y - the axis along which to measure the distance
         Returns:
             - Point: A new point at the specified angle with the given axis distance"""
-        angle_rad = radians(angle)
+        cos_angle, sin_angle = _cos_sin(angle)
 
         if axis == Axis.X:
             # If we want to move axis_distance along x-axis at the given angle
             # x_distance = axis_distance, so we need to find the corresponding y_distance
             # cos(angle) = x_distance / hypotenuse, so hypotenuse = x_distance / cos(angle)
-            if abs(cos(angle_rad)) < 1e-10:
+            if abs(cos_angle) < 1e-10:
                 raise ValueError(
                     f"Cannot move along x-axis at angle {angle} degrees (cos ≈ 0)"
                 )
-            hypotenuse = abs(axis_distance / cos(angle_rad))
+            hypotenuse = abs(axis_distance / cos_angle)
             return Point(
                 self.x + axis_distance,
-                self.y
-                + hypotenuse * sin(angle_rad) * (1 if cos(angle_rad) > 0 else -1),
+                self.y + hypotenuse * sin_angle * (1 if cos_angle > 0 else -1),
             )
         elif axis == Axis.Y:
             # If we want to move axis_distance along y-axis at the given angle
             # y_distance = axis_distance, so we need to find the corresponding x_distance
             # sin(angle) = y_distance / hypotenuse, so hypotenuse = y_distance / sin(angle)
-            if abs(sin(angle_rad)) < 1e-10:
+            if abs(sin_angle) < 1e-10:
                 raise ValueError(
                     f"Cannot move along y-axis at angle {angle} degrees (sin ≈ 0)"
                 )
-            hypotenuse = abs(axis_distance / sin(angle_rad))
+            hypotenuse = abs(axis_distance / sin_angle)
             return Point(
-                self.x
-                + hypotenuse * cos(angle_rad) * (1 if sin(angle_rad) > 0 else -1),
+                self.x + hypotenuse * cos_angle * (1 if sin_angle > 0 else -1),
                 self.y + axis_distance,
             )
         else:
             raise ValueError("axis must be Axis.X or Axis.Y")
 
 
+# the slot descriptors' setters, bound once; calling them skips the by-name
+# attribute lookup of object.__setattr__ on every point constructed
+_set_x = Point.x.__set__
+_set_y = Point.y.__set__
+
+
 def midpoint(point1: Point, point2: Point) -> Point:
     """find the midpoint between two points
     ----------
@@ -178,19 +253,51 @@ def shifted_midpoint(point1: Point, point2: Point, shift: float) -> Point:
             The second point.
         - shift: float
             The distance to shift the midpoint towards point2"""
-    mid_x = (point1.x + point2.x) / 2
-    mid_y = (point1.y + point2.y) / 2
-
     direction_x = point2.x - point1.x
     direction_y = point2.y - point1.y
 
-    # Normalize the direction vector
-    length = (direction_x**2 + direction_y**2) ** 0.5
-    direction_x /= length
-    direction_y /= length
+    # Walk from point1 to the midpoint, then a further `shift` along the
+    # normalized direction towards point2
+    t = 0.5 + shift / hypot(direction_x, direction_y)
 
-    # Shift the midpoint towards point2 by the specified amount
-    shifted_mid_x = mid_x + direction_x * shift
-    shifted_mid_y = mid_y + direction_y * shift
+    return Point(point1.x + direction_x * t, point1.y + direction_y * t)
 
-    return Point(shifted_mid_x, shifted_mid_y)
+
+def midpoints(points1: Iterable[Point], points2: Iterable[Point]) -> list[Point]:
+    """find the midpoint between each pair of points; equivalent to calling
+    midpoint for each pair, and raises a ValueError if the two iterables
+    differ in length
+    ----------
+    Arguments:
+        - points1: Iterable[Point]
+            The first point of each pair.
+        - points2: Iterable[Point]
+            The second point of each pair.
+    Returns:
+        - list[Point]: The midpoint of each pair"""
+    return [
+        Point((point1.x + point2.x) / 2, (point1.y + point2.y) / 2)
+        for point1, point2 in zip(points1, points2, strict=True)
+    ]
+
+
+def shifted_midpoints(
+    points1: Iterable[Point], points2: Iterable[Point], shift: float
+) -> list[Point]:
+    """find the shifted midpoint between each pair of points; equivalent to
+    calling shifted_midpoint for each pair, and raises a ValueError if the
+    two iterables differ in length
+    ----------
+    Arguments:
+        - points1: Iterable[Point]
+            The first point of each pair.
+        - points2: Iterable[Point]
+            The second point of each pair.
+        - shift: float
+            The distance to shift each midpoint towards its second point
+    Returns:
+        - list[Point]: The shifted midpoint of each pair"""
+    return [
+        shifted_midpoint(point1, point2, shift)
+        for point1, point2 in zip(points1, points2, strict=True)
+    ]
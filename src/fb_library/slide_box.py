@@ -22,7 +22,6 @@ from build123d import (
 )
 
 
-from ocp_vscode import show, Camera
 from fb_library import divot
 
 
@@ -203,10 +202,17 @@ def slide_box(
     return box_assembly
 
 
-if __name__ == "__main__":
+def _main():
+    """show an example slide box in the ocp_vscode viewer"""
+    from ocp_vscode import show, Camera
+
     with BuildPart() as base_box:
         Box(20, 44, 14, align=(Align.CENTER, Align.CENTER, Align.MIN))
         fillet(base_box.part.edges().filter_by(Axis.Z), radius=1.5)
 
     sb = slide_box(base_box.part, wall_thickness=2, thumb_radius=3.5, divot_radius=0.5)
     show(sb, reset_camera=Camera.KEEP)
+
+
+if __name__ == "__main__":
+    _main()
@@ -20,8 +20,10 @@ license:
 
 """
 
+from copy import copy
 from dataclasses import dataclass
 from enum import Enum, Flag, auto
+from functools import lru_cache
 from math import radians, cos, sin
 
 from build123d import (
@@ -43,32 +45,19 @@ from build123d import (
     sweep,
 )
 
-from ocp_vscode import Camera, show
 
-
-def twist_snap_connector(
-    connector_radius: float = 4.5,
-    tolerance: float = 0.12,
-    arc_percentage: float = 10,
-    snapfit_count: int = 4,
-    snapfit_radius_extension: float = 2 * 2 / 3,
-    wall_width: float = 2,
-    wall_depth: float = 2,
-    snapfit_height: float = 2,
+@lru_cache(maxsize=32)
+def _twist_snap_connector(
+    connector_radius: float,
+    tolerance: float,
+    arc_percentage: float,
+    snapfit_count: int,
+    snapfit_radius_extension: float,
+    wall_width: float,
+    wall_depth: float,
+    snapfit_height: float,
 ) -> Compound:
-    """
-    Returns a build123d Part a connector that locks into a socket with a twist.
-    ----------
-    Arguments:
-        - connector_radius: the base radius of the connector mechanism
-        - tolerance: the spacing between the connector and the socket
-        - arc_percentage: the percentage of the arc that the snapfit will cover
-        - snapfit_count: how many snapfit mechanisms to add
-        - snapfit_radius_extension: how far beyond the connector the snapfit extends
-        - wall_width: the thickness of the wall mechanism
-        - wall_depth: the depth of the wall mechanism
-        - snapfit_height: the height of the snapfit mechanism
-    """
+    """the build behind twist_snap_connector, cached on its arguments"""
     with BuildPart() as twistbase:
         Cylinder(
             radius=connector_radius,
@@ -125,19 +114,18 @@ def twist_snap_connector(
     return twistbase.part.rotate(Axis.X, 180).move(Location((0, 0, 4)))
 
 
-def twist_snap_socket(
-    connector_radius: float = 4.5,
-    tolerance: float = 0.12,
-    arc_percentage: float = 10,
-    snapfit_count: int = 4,
-    snapfit_radius_extension: float = 2 * 2 / 3,
-    wall_width: float = 2,
-    wall_depth: float = 2,
-    snapfit_height: float = 2,
+@lru_cache(maxsize=32)
+def _twist_snap_socket(
+    connector_radius: float,
+    tolerance: float,
+    arc_percentage: float,
+    snapfit_count: int,
+    snapfit_radius_extension: float,
+    wall_width: float,
+    wall_depth: float,
+    snapfit_height: float,
 ) -> Compound:
-    """
-    Returns a Part for the defined twist snap socket
-    """
+    """the build behind twist_snap_socket, cached on its arguments"""
     outer_socket_radius = connector_radius + wall_width * 4 / 3
     with BuildPart() as socket_fitting:
         Cylinder(
@@ -167,7 +155,7 @@ def twist_snap_socket(
             (arc_percentage / -200) * 1.1,
             (arc_percentage / 200) * 1.1,
         )
-        with BuildPart(mode=Mode.PRIVATE) as snapfit:
+        with BuildPart(mode=Mode.PRIVATE) as snapfit_entry:
             path = path.rotate(Axis.Z, 90)
             with BuildSketch(path ^ 0):
                 Polygon(
@@ -184,17 +172,15 @@ def twist_snap_socket(
                 )
             sweep(path=path)
             fillet(
-                snapfit.faces().sort_by(Axis.Y)[-1].edges().filter_by(Axis.Z),
+                snapfit_entry.faces().sort_by(Axis.Y)[-1].edges().filter_by(Axis.Z),
                 snapfit_radius_extension / 8,
             )
-        with PolarLocations(0, snapfit_count):
-            add(snapfit.part, mode=Mode.SUBTRACT)
 
         path = trace_path.trim(
             (arc_percentage / -200) * 3.3,
             (arc_percentage / 200) * 1.1,
         )
-        with BuildPart(mode=Mode.PRIVATE) as snapfit:
+        with BuildPart(mode=Mode.PRIVATE) as snapfit_lock:
             path = path.rotate(Axis.Z, 90)
             with BuildSketch(path ^ 0):
                 Polygon(
@@ -217,26 +203,104 @@ def twist_snap_socket(
                 )
             sweep(path=path)
             fillet(
-                snapfit.faces().sort_by(Axis.Y)[-1].edges().filter_by(Axis.Z),
+                snapfit_lock.faces().sort_by(Axis.Y)[-1].edges().filter_by(Axis.Z),
                 snapfit_radius_extension / 8,
             )
+        # both cutters are private, so fuse them and subtract the pair once
+        # per location rather than running two boolean cuts at each
+        snapfit_cut = snapfit_entry.part + snapfit_lock.part
         with PolarLocations(0, snapfit_count):
-            add(snapfit.part, mode=Mode.SUBTRACT)
-        with PolarLocations(
-            connector_radius + snapfit_radius_extension + tolerance * 2,
-            snapfit_count,
-            start_angle=arc_percentage * -4,
-        ):
+            add(snapfit_cut, mode=Mode.SUBTRACT)
+        with BuildPart(mode=Mode.PRIVATE) as snapfit_stop:
             Cylinder(
                 radius=snapfit_radius_extension / 2 - tolerance,
                 height=snapfit_height * 2,
                 align=(Align.CENTER, Align.CENTER, Align.MIN),
             )
+        with PolarLocations(
+            connector_radius + snapfit_radius_extension + tolerance * 2,
+            snapfit_count,
+            start_angle=arc_percentage * -4,
+        ):
+            add(snapfit_stop.part)
 
     return socket_fitting.part
 
 
-if __name__ == "__main__":
+def twist_snap_connector(
+    connector_radius: float = 4.5,
+    tolerance: float = 0.12,
+    arc_percentage: float = 10,
+    snapfit_count: int = 4,
+    snapfit_radius_extension: float = 2 * 2 / 3,
+    wall_width: float = 2,
+    wall_depth: float = 2,
+    snapfit_height: float = 2,
+) -> Compound:
+    """
+    Returns a build123d Part a connector that locks into a socket with a twist.
+    ----------
+    Arguments:
+        - connector_radius: the base radius of the connector mechanism
+        - tolerance: the spacing between the connector and the socket
+        - arc_percentage: the percentage of the arc that the snapfit will cover
+        - snapfit_count: how many snapfit mechanisms to add
+        - snapfit_radius_extension: how far beyond the connector the snapfit extends
+        - wall_width: the thickness of the wall mechanism
+        - wall_depth: the depth of the wall mechanism
+        - snapfit_height: the height of the snapfit mechanism
+    """
+    # repeated builds with the same arguments reuse the cached part, which is
+    # never handed out directly: build123d's Shape.__copy__ deep-copies the
+    # BRep before re-sharing its TShape, so every cache hit still pays a full
+    # shape copy, but moving or relabelling the result leaves the cached part
+    # untouched
+    return copy(
+        _twist_snap_connector(
+            connector_radius,
+            tolerance,
+            arc_percentage,
+            snapfit_count,
+            snapfit_radius_extension,
+            wall_width,
+            wall_depth,
+            snapfit_height,
+        )
+    )
+
+
+def twist_snap_socket(
+    connector_radius: float = 4.5,
+    tolerance: float = 0.12,
+    arc_percentage: float = 10,
+    snapfit_count: int = 4,
+    snapfit_radius_extension: float = 2 * 2 / 3,
+    wall_width: float = 2,
+    wall_depth: float = 2,
+    snapfit_height: float = 2,
+) -> Compound:
+    """
+    Returns a Part for the defined twist snap socket
+    """
+    # cached and copied as in twist_snap_connector
+    return copy(
+        _twist_snap_socket(
+            connector_radius,
+            tolerance,
+            arc_percentage,
+            snapfit_count,
+            snapfit_radius_extension,
+            wall_width,
+            wall_depth,
+            snapfit_height,
+        )
+    )
+
+
+def _main():
+    """show an example connector and socket pair in the ocp_vscode viewer"""
+    from ocp_vscode import Camera, show
+
     connector = (
         twist_snap_connector(
             connector_radius=4.5,
@@ -259,3 +323,7 @@ if __name__ == "__main__":
     )
 
     show(connector, socket, reset_camera=Camera.KEEP)
+
+
+if __name__ == "__main__":
+    _main()
@@ -1,14 +1,232 @@
 import sys
 import os
+from contextlib import ExitStack, contextmanager
+from importlib import import_module
+from importlib.machinery import SourceFileLoader
+from unittest.mock import patch
 import pytest
 
-sys.path.insert(
-    0,
-    os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "../src/fb_library")
-    ),
-)
-sys.path.insert(
-    0,
-    os.path.abspath(os.path.join(os.path.dirname(__file__), "../src")),
+_SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../src"))
+_FB_LIBRARY_DIR = os.path.join(_SRC_DIR, "fb_library")
+
+sys.path.insert(0, _FB_LIBRARY_DIR)
+sys.path.insert(0, _SRC_DIR)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="also run tests marked slow (large or extreme geometry)",
+    )
+    parser.addoption(
+        "--run-smoke",
+        action="store_true",
+        default=False,
+        help="also run the smoke tests that execute each module's __main__ block",
+    )
+    parser.addoption(
+        "--run-manual",
+        action="store_true",
+        default=False,
+        help="also run the manual visualization tests (needs the ocp_vscode viewer)",
+    )
+    parser.addoption(
+        "--validate-shapes",
+        action="store_true",
+        default=False,
+        help="run the OCCT validity check on every shape the tests build",
+    )
+
+
+def pytest_configure(config):
+    # the first build123d import pulls in OCP, which takes a second or two;
+    # paying it here, once per process (and so once per xdist worker), keeps
+    # it out of whichever test happens to import build123d first, so the
+    # --durations report is representative. --collect-only runs skip it as
+    # they never build a shape
+    if not config.option.collectonly:
+        import_module("build123d")
+
+
+def pytest_collection_modifyitems(config, items):
+    skips = {
+        marker: pytest.mark.skip(reason=f"{marker} test, use --run-{marker} to run")
+        for marker in ("slow", "smoke", "manual")
+        if not config.getoption(f"--run-{marker}")
+    }
+    for item in items:
+        for marker, skip in skips.items():
+            if marker in item.keywords:
+                item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def validate(request):
+    """returns a callable asserting that a shape is valid; the BRepCheck pass
+    behind is_valid is expensive, so it is a no-op unless --validate-shapes
+    is given. Tests that also check a shape's dimensions use it; tests whose
+    only geometric check is validity assert is_valid directly, so a default
+    run still checks something"""
+    if not request.config.getoption("--validate-shapes"):
+        return lambda shape: None
+
+    def _check(shape):
+        assert shape.is_valid
+
+    # the session-cached parts are validated by many tests; each is checked
+    # once
+    return _memo_by_part(_check)
+
+
+def _memo_by_part(compute):
+    """returns a callable giving compute(part), computed at most once per part;
+    each part is kept alongside its result, so its id can't be reused for a
+    different part while the memo is alive"""
+    results = {}
+
+    def memo(part):
+        if id(part) not in results:
+            results[id(part)] = (part, compute(part))
+        return results[id(part)][1]
+
+    return memo
+
+
+@pytest.fixture(scope="module")
+def bbox():
+    """returns a callable giving part.bounding_box(), computed at most once per
+    part for the module's tests; bounding_box() walks the OCCT topology, and
+    the shared parts are read by several tests"""
+    return _memo_by_part(lambda part: part.bounding_box())
+
+
+@pytest.fixture(scope="module")
+def volume():
+    """returns a callable giving part.volume, computed at most once per part
+    for the module's tests; volume runs a full OCCT mass-property
+    integration"""
+    return _memo_by_part(lambda part: part.volume)
+
+
+@pytest.fixture(scope="session")
+def assert_cyl_bbox():
+    """returns a callable checking that a bounding box is that of an upright
+    cylinder of the given diameter and height; X and Y must agree, so only X
+    is compared against the diameter. Only use it for round or square
+    footprints, polygonal ones such as hexagons need per-axis checks. abs_xy
+    and abs_z default to pytest.approx's own tolerance"""
+
+    def _assert_cyl_bbox(box, diameter, height, abs_xy=None, abs_z=None):
+        size = box.size
+        assert abs(size.X - size.Y) < 1e-6
+        # plain comparisons when a tolerance is given, as this runs for every
+        # parametrized size; pytest.approx only for its default tolerance
+        if abs_xy is None:
+            assert size.X == pytest.approx(diameter)
+        else:
+            assert abs(size.X - diameter) < abs_xy
+        if abs_z is None:
+            assert size.Z == pytest.approx(height)
+        else:
+            assert abs(size.Z - height) < abs_z
+
+    return _assert_cyl_bbox
+
+
+@pytest.fixture(scope="session")
+def sized_box():
+    """returns a callable giving an upright box of the given (x, y, z) size
+    sitting on the XY plane; each size is built once per session and shared,
+    so callers only read from it"""
+    from build123d import Align, Box, BuildPart
+
+    boxes = {}
+
+    def build(size: tuple):
+        if size not in boxes:
+            with BuildPart() as box:
+                Box(*size, align=(Align.CENTER, Align.CENTER, Align.MIN))
+            boxes[size] = box.part
+        return boxes[size]
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def small_base_part(sized_box):
+    """a 20x20x20 box sitting on the XY plane, built once per session"""
+    return sized_box((20, 20, 20))
+
+
+@pytest.fixture(scope="session")
+def default_teardrop():
+    """teardrop_bolt_cut_sinkhole() with its default arguments, built once per
+    session"""
+    from fb_library.bolt_fittings import teardrop_bolt_cut_sinkhole
+
+    return teardrop_bolt_cut_sinkhole()
+
+
+@pytest.fixture(scope="session")
+def default_bolt():
+    """bolt_cut_sinkhole() with its default arguments, built once per session"""
+    from fb_library.bolt_fittings import bolt_cut_sinkhole
+
+    return bolt_cut_sinkhole()
+
+
+@pytest.fixture(scope="session")
+def default_square_nut():
+    """square_nut_sinkhole() with its default arguments, built once per
+    session"""
+    from fb_library.bolt_fittings import square_nut_sinkhole
+
+    return square_nut_sinkhole()
+
+
+# the viewer and file output the modules' __main__ blocks can reach; show is
+# only patched around these runs so the manual tests still reach the viewer,
+# and none of the blocks use pathlib, so the filesystem is left unpatched
+_CAD_IO_TARGETS = (
+    "build123d.export_stl",
+    "ocp_vscode.show",
+    "ocp_vscode.save_screenshot",
 )
+
+
+@contextmanager
+def _cad_io_patches():
+    with ExitStack() as stack:
+        yield {target: stack.enter_context(patch(target)) for target in _CAD_IO_TARGETS}
+
+
+@pytest.fixture(scope="session")
+def direct_run():
+    """returns a callable that executes src/fb_library/<module_name>.py as
+    __main__ with the viewer and file output patched out; each module is only
+    executed once per session, later calls return the same globals. Modules
+    whose __main__ block just calls a _main() function have it called on the
+    regular import instead, so they aren't executed a second time"""
+    executed = {}
+
+    def run(module_name: str) -> dict:
+        if module_name not in executed:
+            module = import_module(f"fb_library.{module_name}")
+            if hasattr(module, "_main"):
+                with _cad_io_patches():
+                    module._main()
+                executed[module_name] = vars(module)
+                return executed[module_name]
+            path = os.path.join(_FB_LIBRARY_DIR, f"{module_name}.py")
+            # unlike runpy.run_path, the loader reuses the __pycache__
+            # bytecode when it is current instead of recompiling the source
+            code = SourceFileLoader("__main__", path).get_code("__main__")
+            run_globals = {"__name__": "__main__", "__file__": path}
+            with _cad_io_patches():
+                exec(code, run_globals)
+            executed[module_name] = run_globals
+        return executed[module_name]
+
+    return run
@@ -1,7 +1,4 @@
 import pytest
-from unittest.mock import patch
-from importlib.machinery import SourceFileLoader
-from importlib.util import module_from_spec, spec_from_loader
 from math import atan, degrees
 from build123d import (
     Align,
@@ -14,37 +11,57 @@ from build123d import (
 from fb_library.antichamfer import anti_chamfer
 
 
+@pytest.fixture(scope="session")
+def unit_box():
+    """a 10x10x10 box built once per session, returned as
+    (part, top_face, bottom_face, volume)"""
+    with BuildPart() as bp:
+        Box(10, 10, 10)
+    part = bp.part
+    z_faces = part.faces().filter_by(Axis.Z)
+    return part, z_faces[-1], z_faces[0], part.volume
+
+
+@pytest.fixture(scope="session")
+def centered_min_z_box():
+    """a 10x10x10 box sitting on the XY plane, built once per session and
+    returned as (part, top_face, volume)"""
+    with BuildPart() as bp:
+        Box(10, 10, 10, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    part = bp.part
+    return part, part.faces().filter_by(Axis.Z)[-1], part.volume
+
+
+_anti_chamfer_cache: dict[tuple, Part] = {}
+
+
+def _cached_anti_chamfer(part, face, length, length2=None) -> Part:
+    """anti_chamfer memoized on the identity of the (session-scoped, never
+    mutated) part and face, so repeated argument sets are only built once"""
+    key = (id(part), id(face), length, length2)
+    if key not in _anti_chamfer_cache:
+        _anti_chamfer_cache[key] = anti_chamfer(part, face, length, length2)
+    return _anti_chamfer_cache[key]
+
+
 class TestAntiChamfer:
-    def test_anti_chamfer_single_face(self):
+    def test_anti_chamfer_single_face(self, unit_box):
         """Test anti_chamfer with a single face"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, original_volume = unit_box
 
         # Apply anti_chamfer
-        result = anti_chamfer(original_part, top_face, 2.0, 1.0)
+        result = _cached_anti_chamfer(original_part, top_face, 2.0, 1.0)
 
         # Check that result is a Part
         assert isinstance(result, Part)
         # Check that the result has more volume than the original (anti-chamfer adds material)
-        assert result.volume > original_part.volume
+        assert result.volume > original_volume
 
-    def test_anti_chamfer_multiple_faces(self):
+    def test_anti_chamfer_multiple_faces(self, unit_box):
         """Test anti_chamfer with multiple faces (iterable)"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
+        original_part, top_face, bottom_face, original_volume = unit_box
 
-        # Get top and bottom faces
-        faces = [
-            original_part.faces().filter_by(Axis.Z)[-1],  # top
-            original_part.faces().filter_by(Axis.Z)[0],  # bottom
-        ]
+        faces = [top_face, bottom_face]
 
         # Apply anti_chamfer
         result = anti_chamfer(original_part, faces, 1.5, 1.0)
@@ -52,41 +69,29 @@ class TestAntiChamfer:
         # Check that result is a Part
         assert isinstance(result, Part)
         # Check that the result has more volume than the original
-        assert result.volume > original_part.volume
+        assert result.volume > original_volume
 
-    def test_anti_chamfer_length2_none_default(self):
+    def test_anti_chamfer_length2_none_default(self, unit_box):
         """Test anti_chamfer with length2=None (should default to length)"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, _ = unit_box
 
         # Apply anti_chamfer with length2=None
-        result1 = anti_chamfer(original_part, top_face, 2.0, None)
+        result1 = _cached_anti_chamfer(original_part, top_face, 2.0, None)
 
         # Apply anti_chamfer with length2=length (should be equivalent)
-        result2 = anti_chamfer(original_part, top_face, 2.0, 2.0)
+        result2 = _cached_anti_chamfer(original_part, top_face, 2.0, 2.0)
 
         # Results should have the same volume
         assert abs(result1.volume - result2.volume) < 1e-6
 
-    def test_anti_chamfer_different_length_values(self):
+    def test_anti_chamfer_different_length_values(self, unit_box):
         """Test anti_chamfer with different length and length2 values"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, _ = unit_box
 
         # Apply anti_chamfer with different length values
-        result1 = anti_chamfer(original_part, top_face, 1.0, 0.5)
-        result2 = anti_chamfer(original_part, top_face, 2.0, 1.0)
-        result3 = anti_chamfer(original_part, top_face, 1.0, 2.0)
+        result1 = _cached_anti_chamfer(original_part, top_face, 1.0, 0.5)
+        result2 = _cached_anti_chamfer(original_part, top_face, 2.0, 1.0)
+        result3 = _cached_anti_chamfer(original_part, top_face, 1.0, 2.0)
 
         # All should be valid Parts
         assert isinstance(result1, Part)
@@ -98,95 +103,27 @@ class TestAntiChamfer:
         assert result1.volume != result3.volume
         assert result2.volume != result3.volume
 
-    def test_anti_chamfer_zero_length_returns_original(self):
-        """Test anti_chamfer with zero length returns original part unchanged"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-        original_volume = original_part.volume
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
-
-        # Apply anti_chamfer with zero length - should return original part
-        result = anti_chamfer(original_part, top_face, 0.0, 0.0)
-
-        # Should return the same part (not modified)
-        assert isinstance(result, Part)
-        assert result.volume == original_volume
-
-    def test_anti_chamfer_zero_length2_returns_original(self):
-        """Test anti_chamfer with zero length2 returns original part unchanged"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-        original_volume = original_part.volume
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
-
-        # Apply anti_chamfer with zero length2 - should return original part
-        result = anti_chamfer(original_part, top_face, 1.0, 0.0)
-
-        # Should return the same part (not modified)
-        assert isinstance(result, Part)
-        assert result.volume == original_volume
-
-    def test_anti_chamfer_zero_length_nonzero_length2_returns_original(self):
-        """Test anti_chamfer with zero length but non-zero length2 returns original part"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-        original_volume = original_part.volume
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+    @pytest.mark.parametrize(
+        "length,length2",
+        [
+            (0.0, 0.0),  # Both zero
+            (0.0, 1.0),  # length zero, length2 non-zero
+            (1.0, 0.0),  # length non-zero, length2 zero
+        ],
+    )
+    def test_anti_chamfer_guard_clause_coverage(self, unit_box, length, length2):
+        """Test that the guard clause returns the original part for any zero length"""
+        original_part, top_face, _, original_volume = unit_box
 
-        # Apply anti_chamfer with zero length but non-zero length2 - should return original part
-        result = anti_chamfer(original_part, top_face, 0.0, 1.0)
+        result = anti_chamfer(original_part, top_face, length, length2)
 
         # Should return the same part (not modified)
         assert isinstance(result, Part)
         assert result.volume == original_volume
 
-    def test_anti_chamfer_guard_clause_coverage(self):
-        """Test that the guard clause properly handles all zero value combinations"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-        original_volume = original_part.volume
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
-
-        # Test all combinations that should trigger the guard clause
-        test_cases = [
-            (0.0, 0.0),  # Both zero
-            (0.0, 1.0),  # length zero, length2 non-zero
-            (1.0, 0.0),  # length non-zero, length2 zero
-        ]
-
-        for length, length2 in test_cases:
-            result = anti_chamfer(original_part, top_face, length, length2)
-            assert isinstance(result, Part)
-            assert (
-                result.volume == original_volume
-            ), f"Failed for length={length}, length2={length2}"
-
-    def test_anti_chamfer_preserves_original_part(self):
+    def test_anti_chamfer_preserves_original_part(self, centered_min_z_box):
         """Test that anti_chamfer includes the original part geometry"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10, align=(Align.CENTER, Align.CENTER, Align.MIN))
-        original_part = bp.part
-        original_volume = original_part.volume
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, original_volume = centered_min_z_box
 
         # Apply anti_chamfer
         result = anti_chamfer(original_part, top_face, 1.0, 0.5)
@@ -211,18 +148,13 @@ class TestAntiChamfer:
         assert isinstance(result, Part)
         assert result.volume > original_part.volume
 
-    def test_anti_chamfer_face_iterable_conversion(self):
+    def test_anti_chamfer_face_iterable_conversion(self, unit_box):
         """Test that single Face is converted to iterable internally"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face (single Face object)
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        # top_face is a single Face object
+        original_part, top_face, _, _ = unit_box
 
         # Test with single Face
-        result1 = anti_chamfer(original_part, top_face, 2.0, 1.0)
+        result1 = _cached_anti_chamfer(original_part, top_face, 2.0, 1.0)
 
         # Test with Face wrapped in list
         result2 = anti_chamfer(original_part, [top_face], 2.0, 1.0)
@@ -230,15 +162,9 @@ class TestAntiChamfer:
         # Results should be equivalent
         assert abs(result1.volume - result2.volume) < 1e-6
 
-    def test_anti_chamfer_taper_calculation(self):
+    def test_anti_chamfer_taper_calculation(self, unit_box):
         """Test that the taper angle calculation is correct"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, original_volume = unit_box
 
         # Test with specific length/length2 ratios that we can verify
         length = 2.0
@@ -246,102 +172,68 @@ class TestAntiChamfer:
         expected_taper = -degrees(atan(length2 / length))
 
         # Apply anti_chamfer - this should use the calculated taper internally
-        result = anti_chamfer(original_part, top_face, length, length2)
+        result = _cached_anti_chamfer(original_part, top_face, length, length2)
 
         # The function should complete without error (taper calculation works)
         assert isinstance(result, Part)
-        assert result.volume > original_part.volume
+        assert result.volume > original_volume
 
-    def test_anti_chamfer_small_values(self):
+    def test_anti_chamfer_small_values(self, unit_box):
         """Test anti_chamfer with very small length values"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, original_volume = unit_box
 
         # Apply anti_chamfer with small values
-        result = anti_chamfer(original_part, top_face, 0.1, 0.05)
+        result = _cached_anti_chamfer(original_part, top_face, 0.1, 0.05)
 
         # Should still work
         assert isinstance(result, Part)
-        assert result.volume > original_part.volume
+        assert result.volume > original_volume
 
-    def test_anti_chamfer_large_values(self):
+    def test_anti_chamfer_large_values(self, unit_box):
         """Test anti_chamfer with large length values relative to part size"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, _ = unit_box
 
         # Apply anti_chamfer with relatively large values
-        result = anti_chamfer(original_part, top_face, 3.0, 2.0)
+        result = _cached_anti_chamfer(original_part, top_face, 3.0, 2.0)
 
         # Should still work (build123d should handle the geometry)
         assert isinstance(result, Part)
 
-    def test_anti_chamfer_length2_greater_than_length(self):
+    def test_anti_chamfer_length2_greater_than_length(self, unit_box):
         """Test anti_chamfer when length2 > length"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, original_volume = unit_box
 
         # Apply anti_chamfer with length2 > length
-        result = anti_chamfer(original_part, top_face, 1.0, 2.0)
+        result = _cached_anti_chamfer(original_part, top_face, 1.0, 2.0)
 
         # Should still work (different taper angle)
         assert isinstance(result, Part)
-        assert result.volume > original_part.volume
+        assert result.volume > original_volume
 
-    def test_anti_chamfer_equal_length_values(self):
+    def test_anti_chamfer_equal_length_values(self, unit_box):
         """Test anti_chamfer when length == length2"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, original_volume = unit_box
 
         # Apply anti_chamfer with equal lengths
-        result = anti_chamfer(original_part, top_face, 1.5, 1.5)
+        result = _cached_anti_chamfer(original_part, top_face, 1.5, 1.5)
 
         # Should work (45-degree taper)
         assert isinstance(result, Part)
-        assert result.volume > original_part.volume
+        assert result.volume > original_volume
 
-    def test_anti_chamfer_negative_length_values(self):
+    def test_anti_chamfer_negative_length_values(self, unit_box):
         """Test anti_chamfer with negative length values"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, _ = unit_box
 
         # Apply anti_chamfer with negative lengths (should still work geometrically)
-        result = anti_chamfer(original_part, top_face, -1.0, -0.5)
+        result = _cached_anti_chamfer(original_part, top_face, -1.0, -0.5)
 
         # Should return a Part (behavior may vary but shouldn't crash)
         assert isinstance(result, Part)
 
-    def test_anti_chamfer_empty_face_list(self):
+    def test_anti_chamfer_empty_face_list(self, unit_box):
         """Test anti_chamfer with empty face list"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-        original_volume = original_part.volume
+        original_part, _, _, original_volume = unit_box
 
         # Apply anti_chamfer with empty face list
         result = anti_chamfer(original_part, [], 1.0, 0.5)
@@ -350,49 +242,28 @@ class TestAntiChamfer:
         assert isinstance(result, Part)
         assert abs(result.volume - original_volume) < 1e-6
 
-    def test_anti_chamfer_very_small_length2(self):
+    def test_anti_chamfer_very_small_length2(self, unit_box):
         """Test anti_chamfer with very small length2 value"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, original_volume = unit_box
 
         # Apply anti_chamfer with very small length2
-        result = anti_chamfer(original_part, top_face, 1.0, 1e-6)
+        result = _cached_anti_chamfer(original_part, top_face, 1.0, 1e-6)
 
         # Should work (very steep taper)
         assert isinstance(result, Part)
-        assert result.volume > original_part.volume
+        assert result.volume > original_volume
 
-    def test_anti_chamfer_parameter_order_matters(self):
+    def test_anti_chamfer_parameter_order_matters(self, unit_box):
         """Test that swapping length and length2 produces different results"""
-        # Create a simple box
-        with BuildPart() as bp:
-            Box(10, 10, 10)
-        original_part = bp.part
-
-        # Get the top face
-        top_face = original_part.faces().filter_by(Axis.Z)[-1]
+        original_part, top_face, _, _ = unit_box
 
         # Apply anti_chamfer with different parameter orders
-        result1 = anti_chamfer(original_part, top_face, 2.0, 1.0)
-        result2 = anti_chamfer(original_part, top_face, 1.0, 2.0)
+        result1 = _cached_anti_chamfer(original_part, top_face, 2.0, 1.0)
+        result2 = _cached_anti_chamfer(original_part, top_face, 1.0, 2.0)
 
         # Results should be different
         assert abs(result1.volume - result2.volume) > 1e-6
 
-    def test_direct_run(self):
-
-        with (
-            patch("build123d.export_stl"),
-            patch("pathlib.Path.mkdir"),
-            patch("pathlib.Path.exists"),
-            patch("pathlib.Path.is_dir"),
-            patch("ocp_vscode.show"),
-            patch("ocp_vscode.save_screenshot"),
-        ):
-            loader = SourceFileLoader("__main__", "src/fb_library/antichamfer.py")
-            loader.exec_module(module_from_spec(spec_from_loader(loader.name, loader)))
+    @pytest.mark.smoke
+    def test_direct_run(self, direct_run):
+        direct_run("antichamfer")
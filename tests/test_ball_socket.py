@@ -1,12 +1,15 @@
-from importlib.machinery import SourceFileLoader
-from importlib.util import module_from_spec, spec_from_loader
-from unittest.mock import patch
-import math
+from functools import lru_cache
+from math import pi
+
 import pytest
 from build123d import Part
 
 from fb_library.ball_socket import ball_mount, ball_socket
 
+# the tests share the session-cached mounts and sockets, so keep them on one
+# xdist worker rather than rebuilding the cache on each
+pytestmark = pytest.mark.xdist_group(name="occt")
+
 
 # ---------- Helpers ----------
 def expected_socket_height(r: float, w: float) -> float:
@@ -18,246 +21,299 @@ def expected_socket_diameter(r: float, w: float) -> float:
     return 2 * (r + w)
 
 
+def expected_solid_volume(r: float, w: float) -> float:
+    # a solid cylinder filling the socket's outer envelope
+    return pi * (r + w) ** 2 * expected_socket_height(r, w)
+
+
+def _size_xyz(box) -> tuple[float, float, float]:
+    """(sx, sy, sz): the size of a bounding box"""
+    size = box.size
+    return size.X, size.Y, size.Z
+
+
+def _assert_centered_xy(box):
+    # the box is symmetric about the Z axis exactly when min + max is zero,
+    # which avoids building the center() Vector
+    mn, mx = box.min, box.max
+    assert abs(mn.X + mx.X) < 0.02 and abs(mn.Y + mx.Y) < 0.02
+
+
+@pytest.fixture(scope="session")
+def cached_ball_mount():
+    """ball_mount memoized for the session; tests only read from the parts,
+    so one instance per radius is shared"""
+
+    @lru_cache(maxsize=64)
+    def build(r: float):
+        return ball_mount(r)
+
+    return build
+
+
+@pytest.fixture(scope="session")
+def cached_ball_socket():
+    """ball_socket memoized for the session; the defaults mirror ball_socket
+    and are filled in before the cache lookup, so cached_ball_socket(10) and
+    cached_ball_socket(10, 2.0, 0.1) share an entry"""
+
+    @lru_cache(maxsize=64)
+    def _build(r: float, w: float, t: float):
+        return ball_socket(r, wall_thickness=w, tolerance=t)
+
+    def build(r: float, w: float = 2.0, t: float = 0.1):
+        return _build(r, w, t)
+
+    return build
+
+
+@pytest.fixture(
+    scope="session",
+    params=[(3, 2), (5, 1), (5, 2), (10, 2), (12, 3), (12.5, 3.5), (18, 4), (20, 4)],
+    ids=lambda rw: f"r{rw[0]}-w{rw[1]}",
+)
+def sized_socket(request, cached_ball_socket):
+    """(ball_radius, wall_thickness, socket) for each size checked by the
+    dimension tests"""
+    r, w = request.param
+    return r, w, cached_ball_socket(r, w)
+
+
+@pytest.fixture
+def variant_socket(request, cached_ball_socket):
+    """(ball_radius, wall_thickness, socket) for an indirectly parametrized
+    (ball_radius, wall_thickness, tolerance); the socket is built during
+    fixture setup, on whichever xdist worker runs the test"""
+    r, w, t = request.param
+    return r, w, cached_ball_socket(r, w, t)
+
+
 # ---------- Ball Mount Tests ----------
 class TestBallMount:
-    def test_ball_mount_basic(self):
-        mount = ball_mount(10.0)
-        assert isinstance(mount, Part)
-        assert mount.is_valid
-        bbox = mount.bounding_box()
-        assert bbox.size.X == pytest.approx(20.0, abs=0.1)
-        assert bbox.size.Y == pytest.approx(20.0, abs=0.1)
+    @pytest.mark.parametrize(
+        "r",
+        [
+            0.5,
+            1.0,
+            2.0,
+            7.5,
+            10.0,
+            pytest.param(25.0, marks=pytest.mark.slow),
+            pytest.param(50.0, marks=pytest.mark.slow),
+        ],
+        ids=lambda r: f"r{r:g}",
+    )
+    def test_ball_mount_dimensions(self, r, cached_ball_mount, validate, bbox):
+        mount = cached_ball_mount(r)
+        assert type(mount) is Part
+        validate(mount)
+        sx, sy, sz = _size_xyz(bbox(mount))
+        assert abs(sx - 2 * r) < 0.05 and abs(sy - 2 * r) < 0.05
         # Height = 3.5 * radius (shaft from 0 to 2.25R, sphere center at 2.5R -> top 3.5R)
-        assert bbox.size.Z == pytest.approx(35.0, abs=0.5)
-
-    @pytest.mark.parametrize("r", [0.5, 2.0, 7.5, 10.0, 25.0])
-    def test_ball_mount_dimensions(self, r):
-        mount = ball_mount(r)
-        assert mount.is_valid
-        bbox = mount.bounding_box()
-        assert bbox.size.X == pytest.approx(2 * r, abs=0.05)
-        assert bbox.size.Y == pytest.approx(2 * r, abs=0.05)
-        assert bbox.size.Z == pytest.approx(3.5 * r, rel=0.02)
-
-    def test_ball_mount_centering(self):
-        mount = ball_mount(10.0)
-        bbox = mount.bounding_box()
-        assert abs(bbox.center().X) < 0.01
-        assert abs(bbox.center().Y) < 0.01
-
-    def test_ball_mount_volume_positive(self):
-        assert ball_mount(5).volume > 0
-
-    def test_ball_mount_shaft_geometry(self):
-        mount = ball_mount(10.0)
+        assert abs(sz - 3.5 * r) < 0.02 * 3.5 * r
+
+    def test_ball_mount_centering(self, cached_ball_mount, bbox):
+        mount = cached_ball_mount(10.0)
+        _assert_centered_xy(bbox(mount))
+
+    def test_ball_mount_volume_positive(self, cached_ball_mount, volume):
+        assert volume(cached_ball_mount(5)) > 0
+
+    def test_ball_mount_shaft_geometry(self, cached_ball_mount, bbox):
+        mount = cached_ball_mount(10.0)
         # Basic sanity: top > 34, bottom at 0
-        bbox = mount.bounding_box()
-        assert bbox.min.Z == pytest.approx(0.0, abs=0.05)
-        assert bbox.max.Z == pytest.approx(35.0, abs=0.5)
+        box = bbox(mount)
+        assert box.min.Z == pytest.approx(0.0, abs=0.05)
+        assert box.max.Z == pytest.approx(35.0, abs=0.5)
 
 
 # ---------- Ball Socket Tests (Updated for new geometry) ----------
 class TestBallSocket:
-    def test_ball_socket_basic(self):
-        r = 10.0
-        w = 2.0
-        socket = ball_socket(r)
-        assert isinstance(socket, Part)
-        assert socket.is_valid
+    @pytest.mark.parametrize(
+        "variant_socket",
+        [
+            (10.0, 2.0, 0.1),  # defaults
+            (10.0, 3.0, 0.1),  # custom wall thickness
+            (3.0, 2.0, 0.1),  # small radius
+            (20.0, 2.0, 0.1),  # large radius
+            (7.5, 1.5, 0.05),  # fractional radius
+            (1.0, 0.5, 0.01),  # tiny socket
+            (10.0, 8.0, 0.5),  # very thick walls, loose fit
+            pytest.param((50.0, 10.0, 2.0), marks=pytest.mark.slow),  # huge socket
+            # (10.0, 0.1, -0.05) is left out - too thin walls cause fillet issues
+        ],
+        indirect=True,
+        ids=lambda rwt: f"r{rwt[0]:g}-w{rwt[1]:g}-t{rwt[2]:g}",
+    )
+    def test_ball_socket_variant_dimensions(
+        self, variant_socket, assert_cyl_bbox, validate, bbox
+    ):
+        r, w, socket = variant_socket
+        assert type(socket) is Part
+        validate(socket)
         assert socket.label == "Ball Socket"
-        bbox = socket.bounding_box()
-        assert bbox.size.X == pytest.approx(expected_socket_diameter(r, w), abs=0.1)
-        assert bbox.size.Y == pytest.approx(expected_socket_diameter(r, w), abs=0.1)
-        assert bbox.size.Z == pytest.approx(expected_socket_height(r, w), abs=0.1)
-
-    @pytest.mark.parametrize("r,w", [(3, 2), (5, 1), (10, 2), (20, 4), (12.5, 3.5)])
-    def test_ball_socket_param_dimensions(self, r, w):
-        socket = ball_socket(r, wall_thickness=w)
-        assert socket.is_valid
-        bbox = socket.bounding_box()
-        assert bbox.size.X == pytest.approx(expected_socket_diameter(r, w), abs=0.1)
-        assert bbox.size.Y == pytest.approx(expected_socket_diameter(r, w), abs=0.1)
-        assert bbox.size.Z == pytest.approx(expected_socket_height(r, w), abs=0.1)
-        assert bbox.min.Z == pytest.approx(0.0, abs=0.01)
-
-    def test_ball_socket_custom_wall_thickness(self):
-        r, w = 10.0, 3.0
-        socket = ball_socket(r, wall_thickness=w)
-        bbox = socket.bounding_box()
-        assert bbox.size.X == pytest.approx(expected_socket_diameter(r, w), abs=0.1)
-        assert bbox.size.Z == pytest.approx(expected_socket_height(r, w), abs=0.1)
-
-    def test_ball_socket_tolerance_does_not_change_outer_size(self):
+        assert_cyl_bbox(
+            bbox(socket),
+            expected_socket_diameter(r, w),
+            expected_socket_height(r, w),
+            abs_xy=0.1,
+            abs_z=0.1,
+        )
+
+    def test_ball_socket_param_dimensions(
+        self, sized_socket, assert_cyl_bbox, validate, bbox
+    ):
+        r, w, socket = sized_socket
+        validate(socket)
+        assert_cyl_bbox(
+            bbox(socket),
+            expected_socket_diameter(r, w),
+            expected_socket_height(r, w),
+            abs_xy=0.1,
+            abs_z=0.1,
+        )
+        assert abs(bbox(socket).min.Z) < 0.01
+
+    def test_ball_socket_tolerance_does_not_change_outer_size(
+        self, cached_ball_socket, bbox
+    ):
         r, w = 10.0, 2.0
-        base_bbox = ball_socket(r).bounding_box()
+        base_sx, _, base_sz = _size_xyz(bbox(cached_ball_socket(r)))
         for tol in [-0.1, 0.0, 0.1, 0.5]:
-            bbox = ball_socket(r, tolerance=tol).bounding_box()
-            assert bbox.size.X == pytest.approx(base_bbox.size.X, abs=0.05)
-            assert bbox.size.Z == pytest.approx(base_bbox.size.Z, abs=0.05)
+            sx, _, sz = _size_xyz(bbox(cached_ball_socket(r, 2.0, tol)))
+            assert sx == pytest.approx(base_sx, abs=0.05)
+            assert sz == pytest.approx(base_sz, abs=0.05)
 
-    def test_ball_socket_tolerance_volume_effect(self):
+    def test_ball_socket_tolerance_volume_effect(
+        self, cached_ball_socket, validate, volume
+    ):
         r, w = 10.0, 2.0
-        loose = ball_socket(r, wall_thickness=w, tolerance=0.5)
-        tight = ball_socket(r, wall_thickness=w, tolerance=-0.05)
-        assert loose.is_valid and tight.is_valid
+        loose = cached_ball_socket(r, w, 0.5)
+        tight = cached_ball_socket(r, w, -0.05)
+        validate(loose)
+        validate(tight)
         # Larger positive tolerance removes more -> smaller remaining part volume
-        assert loose.volume < tight.volume
-
-    def test_ball_socket_wall_thickness_volume_growth(self):
-        r = 10.0
-        thin = ball_socket(r, wall_thickness=1.0)
-        thick = ball_socket(r, wall_thickness=5.0)
-        assert thin.volume < thick.volume
-
-    def test_ball_socket_centered(self):
-        socket = ball_socket(10.0)
-        bbox = socket.bounding_box()
-        assert abs(bbox.center().X) < 0.01
-        assert abs(bbox.center().Y) < 0.01
-        assert bbox.min.Z == pytest.approx(0.0, abs=0.01)
-
-    def test_ball_socket_small_radius(self):
-        r, w = 3.0, 2.0
-        socket = ball_socket(r)
-        bbox = socket.bounding_box()
-        assert bbox.size.X == pytest.approx(expected_socket_diameter(r, w), abs=0.1)
-        assert bbox.size.Z == pytest.approx(expected_socket_height(r, w), abs=0.1)
-
-    def test_ball_socket_large_radius(self):
-        r, w = 20.0, 2.0
-        socket = ball_socket(r)
-        bbox = socket.bounding_box()
-        assert bbox.size.X == pytest.approx(expected_socket_diameter(r, w), abs=0.1)
-        assert bbox.size.Z == pytest.approx(expected_socket_height(r, w), abs=0.1)
-
-    def test_ball_socket_fractional_radius(self):
-        r, w = 7.5, 1.5
-        socket = ball_socket(r, wall_thickness=w, tolerance=0.05)
-        bbox = socket.bounding_box()
-        assert bbox.size.X == pytest.approx(expected_socket_diameter(r, w), abs=0.1)
-        assert bbox.size.Y == pytest.approx(expected_socket_diameter(r, w), abs=0.1)
-
-    def test_ball_socket_has_flex_cuts_volume_reduction(self):
+        assert volume(loose) < volume(tight)
+
+    def test_ball_socket_centered(self, cached_ball_socket, bbox):
+        socket = cached_ball_socket(10.0)
+        _assert_centered_xy(bbox(socket))
+        assert bbox(socket).min.Z == pytest.approx(0.0, abs=0.01)
+
+    @pytest.mark.parametrize(
+        "t,max_ratio", [(0.1, 0.9), (0.0, 0.95)], ids=["t0.1", "t0"]
+    )
+    def test_ball_socket_flex_cuts_reduce_volume(
+        self, t, max_ratio, cached_ball_socket, bbox, volume
+    ):
         r, w = 10.0, 2.0
-        socket = ball_socket(r)
-        assert socket.volume > 0
+        socket = cached_ball_socket(r, w, t)
+        socket_volume = volume(socket)
+        assert socket_volume > 0
+        assert bbox(socket).min.Z == pytest.approx(0.0, abs=0.01)
         # Compare to solid cylinder of same outer size
-        solid_volume = math.pi * (r + w) ** 2 * expected_socket_height(r, w)
-        assert socket.volume < solid_volume * 0.9  # should be noticeably reduced
+        assert socket_volume < expected_solid_volume(r, w) * max_ratio
 
 
 # ---------- Pair Compatibility ----------
+PAIR_RADII = [2.0, 5.0, 10.0, 12.0, 15.0, 20.0]
+
+
 class TestBallSocketPairCompatibility:
-    @pytest.mark.parametrize("r", [2.0, 5.0, 10.0, 15.0, 20.0])
-    def test_mount_socket_compatibility(self, r):
-        mount = ball_mount(r)
-        socket = ball_socket(r)
+    @pytest.mark.parametrize("r", PAIR_RADII, ids=lambda r: f"r{r:g}")
+    def test_mount_socket_compatibility(
+        self, r, cached_ball_mount, cached_ball_socket, bbox
+    ):
+        mount = cached_ball_mount(r)
+        socket = cached_ball_socket(r)
         assert mount.is_valid and socket.is_valid
-        mount_bbox = mount.bounding_box()
-        socket_bbox = socket.bounding_box()
+        mount_sx, _, mount_sz = _size_xyz(bbox(mount))
+        socket_sx, _, socket_sz = _size_xyz(bbox(socket))
         # Mount ball diameter should be <= socket outer diameter
-        assert mount_bbox.size.X <= socket_bbox.size.X
+        assert mount_sx <= socket_sx
         # Mount should be taller than socket for most cases, but may be equal for small r
         # Mount height: 3.5R, Socket height: R + 2.5w (where w=2 by default)
         # For r=2, w=2: mount≈7, socket≈7 (approximately equal due to geometry)
         # For r>2.86, mount > socket
         if r > 2.86:
-            assert mount_bbox.size.Z > socket_bbox.size.Z
+            assert mount_sz > socket_sz
         else:
             # Use approximate comparison for small radii due to floating-point precision
-            assert mount_bbox.size.Z == pytest.approx(socket_bbox.size.Z, abs=0.01)
-
-    def test_multiple_radius_compatibility(self):
-        for r in [2.0, 5.0, 10.0, 15.0, 20.0]:
-            assert ball_mount(r).is_valid
-            assert ball_socket(r).is_valid
+            assert abs(mount_sz - socket_sz) < 0.01
 
 
 # ---------- Edge / Extreme Cases ----------
 class TestEdgeCases:
 
-    def test_extreme_tolerance_values(self):
-        tight = ball_socket(10.0, tolerance=-0.1)
-        loose = ball_socket(10.0, tolerance=1.0)
-        assert tight.is_valid
-        assert loose.is_valid
-        assert loose.volume < ball_socket(10.0, tolerance=0.0).volume
+    def test_extreme_tolerance_values(self, cached_ball_socket, validate, volume):
+        tight = cached_ball_socket(10.0, 2.0, -0.1)
+        loose = cached_ball_socket(10.0, 2.0, 1.0)
+        validate(tight)
+        validate(loose)
+        assert volume(loose) < volume(cached_ball_socket(10.0, 2.0, 0.0))
 
-    def test_parameter_validation_edge_cases(self):
-        cases = [
+    @pytest.mark.parametrize(
+        "r,w,t",
+        [
             (1.0, 0.5, 0.01),
-            (50.0, 10.0, 2.0),
-            # Skip (10.0, 0.1, -0.05) - too thin walls cause fillet issues
+            pytest.param(50.0, 10.0, 2.0, marks=pytest.mark.slow),
+            # (10.0, 0.1, -0.05) is left out - too thin walls cause fillet issues
             (10.0, 8.0, 0.5),
-        ]
-        for r, w, t in cases:
-            assert ball_mount(r).is_valid
-            # Skip socket test for very thin walls
-            if w >= 0.5:  # Only test if wall thickness is reasonable
-                assert ball_socket(r, w, t).is_valid
+        ],
+        ids=lambda v: f"{v:g}",
+    )
+    def test_parameter_validation_edge_cases(
+        self, r, w, t, cached_ball_mount, cached_ball_socket
+    ):
+        # the edge case sizes are where the fillets are most likely to break
+        # the shape, so their validity is checked on every run
+        assert cached_ball_mount(r).is_valid
+        assert cached_ball_socket(r, w, t).is_valid
 
 
 # ---------- Direct Run ----------
 class TestDirectRun:
-    def test_direct_run(self):
-        with patch("ocp_vscode.show"):
-            loader = SourceFileLoader("__main__", "src/fb_library/ball_socket.py")
-            loader.exec_module(module_from_spec(spec_from_loader(loader.name, loader)))
+    @pytest.mark.smoke
+    def test_direct_run(self, direct_run):
+        direct_run("ball_socket")
 
 
 # ---------- Geometry Details ----------
 class TestGeometryDetails:
-    def test_ball_mount_shaft_taper(self):
+    def test_ball_mount_shaft_taper(self, cached_ball_mount, bbox):
         r = 10.0
-        mount = ball_mount(r)
-        bbox = mount.bounding_box()
-        assert bbox.max.Z >= 35 - 0.5  # top tolerance
-        assert bbox.min.Z == pytest.approx(0.0, abs=0.05)
+        mount = cached_ball_mount(r)
+        box = bbox(mount)
+        assert box.max.Z >= 35 - 0.5  # top tolerance
+        assert box.min.Z == pytest.approx(0.0, abs=0.05)
 
-    def test_ball_socket_internal_features(self):
-        r = 10.0
-        socket = ball_socket(r)
-        bbox = socket.bounding_box()
-        assert socket.volume > 0
-        assert bbox.min.Z == pytest.approx(0.0, abs=0.01)
-
-    def test_socket_filleted_top_exists(self):
+    def test_socket_filleted_top_exists(self, cached_ball_socket, validate, bbox):
         # Indirect: ensure top height unchanged but internal edge count reduced after fillet
         r, w = 10.0, 2.0
-        socket = ball_socket(r, wall_thickness=w)
-        assert socket.is_valid
-        bbox = socket.bounding_box()
-        assert bbox.size.Z == pytest.approx(expected_socket_height(r, w), abs=0.1)
-
-    def test_flex_cuts_reduce_volume(self):
-        r, w = 10.0, 2.0
-        base = ball_socket(r, wall_thickness=w, tolerance=0.0)
-        # Simulate no flex cuts by creating a temporary variant (approximate by comparing to solid cylinder)
-        solid_volume = math.pi * (r + w) ** 2 * expected_socket_height(r, w)
-        assert base.volume < solid_volume * 0.95  # noticeable reduction
+        socket = cached_ball_socket(r, w)
+        validate(socket)
+        _, _, sz = _size_xyz(bbox(socket))
+        assert sz == pytest.approx(expected_socket_height(r, w), abs=0.1)
 
-    def test_volume_monotonic_with_wall_thickness(self):
+    def test_volume_monotonic_with_wall_thickness(self, cached_ball_socket, volume):
         r = 10.0
         vols = []
-        for w in [0.5, 1.0, 2.0, 3.0]:
-            vols.append(ball_socket(r, wall_thickness=w).volume)
+        for w in [0.5, 1.0, 2.0, 3.0, 5.0]:
+            vols.append(volume(cached_ball_socket(r, w)))
         assert vols == sorted(vols)
 
 
 # ---------- New Additional Robustness Tests ----------
 class TestAdditional:
-    @pytest.mark.parametrize("tol", [-0.2, -0.05, 0.0, 0.1, 0.4])
-    def test_tolerance_monotonic_volume(self, tol):
+    def test_tolerance_monotonic_volume(self, cached_ball_socket, volume):
         r, w = 8.0, 2.0
         # Larger tolerance -> larger internal cavity -> smaller remaining part
-        base_vols = {}
-        for t in sorted([-0.2, -0.05, 0.0, 0.1, 0.4]):
-            base_vols[t] = ball_socket(r, wall_thickness=w, tolerance=t).volume
-        # Check ordering
-        ordered = [base_vols[t] for t in sorted(base_vols)]
+        ordered = [
+            volume(cached_ball_socket(r, w, t)) for t in [-0.2, -0.05, 0.0, 0.1, 0.4]
+        ]
         assert ordered == sorted(ordered, reverse=True)
 
-    @pytest.mark.parametrize("r,w", [(5, 2), (12, 3), (18, 4)])
-    def test_height_formula_consistency(self, r, w):
-        bbox = ball_socket(r, wall_thickness=w).bounding_box()
-        assert bbox.size.Z == pytest.approx(expected_socket_height(r, w), abs=0.1)
+    def test_height_formula_consistency(self, sized_socket, bbox):
+        r, w, socket = sized_socket
+        _, _, sz = _size_xyz(bbox(socket))
+        assert abs(sz - expected_socket_height(r, w)) < 0.1
@@ -9,40 +9,110 @@ These tests cover all functions and their parameters to ensure:
 - Mutation testing coverage
 """
 
+import gc
+from functools import lru_cache
+from itertools import pairwise
+from math import isclose
+
 import pytest
-from build123d import (
-    Align,
-    Axis,
-    BuildPart,
-    Part,
-)
+from build123d import Part
 from fb_library.bolt_fittings import (
     teardrop_bolt_cut_sinkhole,
     bolt_cut_sinkhole,
     square_nut_sinkhole,
 )
 
+# (shaft_radius, shaft_depth, head_radius, head_depth, chamfer_radius,
+#  extension_distance) combinations shared by both bolt cut builders
+BOLT_PARAMS = (
+    "shaft_radius",
+    "shaft_depth",
+    "head_radius",
+    "head_depth",
+    "chamfer_radius",
+    "extension_distance",
+)
+BOLT_CASES = [
+    (2.0, 5.0, 3.1, 5.0, 1.0, 100),  # custom shaft
+    (1.65, 2.0, 4.0, 3.0, 1.0, 100),  # custom head
+    (1.5, 2.0, 3.0, 5.0, 1.0, 100),  # head larger than shaft
+    (0.5, 1.0, 1.0, 1.5, 0.2, 100),  # small dimensions
+    (5.0, 10.0, 8.0, 8.0, 2.0, 100),  # large dimensions
+    (1.0, 2.0, 2.0, 3.0, 0.5, 10),
+    (2.0, 3.0, 4.0, 5.0, 1.0, 50),
+    (1.65, 2.0, 3.1, 5.0, 1.0, 100),
+]
 
-class TestTeardropBoltCutSinkhole:
-    def test_teardrop_bolt_cut_default_parameters(self):
-        """Test teardrop bolt cut with default parameters"""
-        result = teardrop_bolt_cut_sinkhole()
 
-        assert isinstance(result, Part)
-        assert result.volume > 0
+_BUILDERS = {
+    "bolt": bolt_cut_sinkhole,
+    "teardrop": teardrop_bolt_cut_sinkhole,
+}
 
-    def test_teardrop_bolt_cut_custom_shaft(self):
-        """Test teardrop bolt cut with custom shaft dimensions"""
-        result = teardrop_bolt_cut_sinkhole(shaft_radius=2.0, shaft_depth=5.0)
 
-        assert isinstance(result, Part)
-        assert result.volume > 0
+@lru_cache(maxsize=32)
+def _cached_build(kind: str, items: tuple) -> Part:
+    return _BUILDERS[kind](**dict(items))
+
+
+def _build(kind: str, **kwargs) -> Part:
+    """builds a bolt or teardrop cut, reusing the part for any (kind, kwargs)
+    already built this session; the comparison tests only read the volume,
+    so sharing the part is safe"""
+    return _cached_build(kind, tuple(sorted(kwargs.items())))
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _release_cached_parts():
+    """drops the memoized parts once this module's tests are done, so their
+    OCCT shapes aren't held for the rest of the session"""
+    yield
+    _cached_build.cache_clear()
+    gc.collect()
+
+
+# relative tolerance for volumes that should be identical; relative, as the
+# absolute error of the mass-property integration grows with the part
+VOL_TOL_REL = 1e-9
+
+
+# the shaft/head sizes the teardrop_ratio comparisons are made at
+RATIO_BASE_PARAMS = {
+    "shaft_radius": 1.65,
+    "shaft_depth": 2.0,
+    "head_radius": 3.1,
+    "head_depth": 5.0,
+    "chamfer_radius": 1.0,
+    "extension_distance": 10.0,
+}
+SWEEP_RATIOS = (1.0, 1.05, 1.1, 1.15, 1.2)
 
-    def test_teardrop_bolt_cut_custom_head(self):
-        """Test teardrop bolt cut with custom head dimensions"""
-        result = teardrop_bolt_cut_sinkhole(head_radius=4.0, head_depth=3.0)
 
-        assert isinstance(result, Part)
+@pytest.fixture(scope="module")
+def ratio_sweep(volume):
+    """{teardrop_ratio: volume} for the teardrop cut at RATIO_BASE_PARAMS,
+    built once for all of the ratio tests"""
+    return {
+        ratio: volume(_build("teardrop", **RATIO_BASE_PARAMS, teardrop_ratio=ratio))
+        for ratio in SWEEP_RATIOS
+    }
+
+
+def _bolt_case_id(case: tuple) -> str:
+    shaft_r, shaft_d, head_r, head_d, chamfer_r, ext = case
+    return f"s{shaft_r}x{shaft_d}-h{head_r}x{head_d}-c{chamfer_r}-e{ext}"
+
+
+class TestTeardropBoltCutSinkhole:
+    def test_teardrop_bolt_cut_default_parameters(self, default_teardrop):
+        """Test teardrop bolt cut with default parameters"""
+        assert default_teardrop.volume > 0
+
+    @pytest.mark.parametrize("case", BOLT_CASES, ids=_bolt_case_id)
+    def test_teardrop_bolt_cut_parameter_combinations(self, case):
+        """Test teardrop bolt cut across shaft/head/chamfer/extension sizes"""
+        result = teardrop_bolt_cut_sinkhole(**dict(zip(BOLT_PARAMS, case)))
+
         assert result.volume > 0
 
     def test_teardrop_bolt_cut_with_chamfer(self):
@@ -50,159 +120,54 @@ class TestTeardropBoltCutSinkhole:
         result1 = teardrop_bolt_cut_sinkhole(chamfer_radius=0.5)
         result2 = teardrop_bolt_cut_sinkhole(chamfer_radius=2.0)
 
-        assert isinstance(result1, Part)
-        assert isinstance(result2, Part)
         # Different chamfer radii should produce different volumes
         assert result1.volume != result2.volume
 
-    def test_teardrop_bolt_cut_with_extension(self):
+    def test_teardrop_bolt_cut_with_extension(self, volume):
         """Test teardrop bolt cut with extension distance"""
-        result_with = teardrop_bolt_cut_sinkhole(extension_distance=50)
-        result_without = teardrop_bolt_cut_sinkhole(extension_distance=0)
+        result_with = _build("teardrop", extension_distance=50)
+        result_without = _build("teardrop", extension_distance=0)
 
-        assert isinstance(result_with, Part)
-        assert isinstance(result_without, Part)
         # With extension should have more volume
-        assert result_with.volume > result_without.volume
+        assert volume(result_with) > volume(result_without)
 
-    def test_teardrop_bolt_cut_zero_extension(self):
+    def test_teardrop_bolt_cut_zero_extension(self, volume):
         """Test teardrop bolt cut with zero extension (blind hole)"""
-        result = teardrop_bolt_cut_sinkhole(extension_distance=0)
-
-        assert isinstance(result, Part)
-        assert result.volume > 0
-
-    def test_teardrop_bolt_cut_small_dimensions(self):
-        """Test teardrop bolt cut with small dimensions"""
-        result = teardrop_bolt_cut_sinkhole(
-            shaft_radius=0.5,
-            shaft_depth=1.0,
-            head_radius=1.0,
-            head_depth=1.5,
-            chamfer_radius=0.2,
-        )
-
-        assert isinstance(result, Part)
-        assert result.volume > 0
-
-    def test_teardrop_bolt_cut_large_dimensions(self):
-        """Test teardrop bolt cut with large dimensions"""
-        result = teardrop_bolt_cut_sinkhole(
-            shaft_radius=5.0,
-            shaft_depth=10.0,
-            head_radius=8.0,
-            head_depth=8.0,
-            chamfer_radius=2.0,
-        )
-
-        assert isinstance(result, Part)
-        assert result.volume > 0
-
-    def test_teardrop_bolt_cut_head_larger_than_shaft(self):
-        """Test that head radius is larger than shaft radius"""
-        result = teardrop_bolt_cut_sinkhole(shaft_radius=1.5, head_radius=3.0)
+        result = _build("teardrop", extension_distance=0)
 
-        assert isinstance(result, Part)
-        # Head should create additional volume beyond shaft
-        assert result.volume > 0
+        assert volume(result) > 0
 
-    def test_teardrop_bolt_cut_parameter_combinations(self):
-        """Test various parameter combinations"""
-        combinations = [
-            (1.0, 2.0, 2.0, 3.0, 0.5, 10),
-            (2.0, 3.0, 4.0, 5.0, 1.0, 50),
-            (1.65, 2.0, 3.1, 5.0, 1.0, 100),
-        ]
-
-        for shaft_r, shaft_d, head_r, head_d, chamfer_r, ext in combinations:
-            result = teardrop_bolt_cut_sinkhole(
-                shaft_radius=shaft_r,
-                shaft_depth=shaft_d,
-                head_radius=head_r,
-                head_depth=head_d,
-                chamfer_radius=chamfer_r,
-                extension_distance=ext,
-            )
-            assert isinstance(result, Part)
-            assert result.volume > 0
-
-    def test_teardrop_bolt_cut_custom_teardrop_ratio(self):
+    def test_teardrop_bolt_cut_custom_teardrop_ratio(self, ratio_sweep):
         """Test teardrop bolt cut with custom teardrop_ratio"""
-        result1 = teardrop_bolt_cut_sinkhole(teardrop_ratio=1.0)  # Cylindrical
-        result2 = teardrop_bolt_cut_sinkhole(teardrop_ratio=1.1)  # Default teardrop
-        result3 = teardrop_bolt_cut_sinkhole(
-            teardrop_ratio=1.2
-        )  # More pronounced teardrop
-
-        assert isinstance(result1, Part)
-        assert isinstance(result2, Part)
-        assert isinstance(result3, Part)
-        # Larger ratios should produce larger volumes
-        assert result1.volume < result2.volume < result3.volume
-
-    def test_teardrop_bolt_cut_ratio_1_0_equals_cylindrical(self):
-        """Test that teardrop_ratio=1.0 produces same result as bolt_cut_sinkhole"""
-        params = {
-            "shaft_radius": 1.65,
-            "shaft_depth": 2.0,
-            "head_radius": 3.1,
-            "head_depth": 5.0,
-            "chamfer_radius": 1.0,
-            "extension_distance": 10.0,
-        }
+        # Cylindrical < default teardrop < more pronounced teardrop
+        assert ratio_sweep[1.0] < ratio_sweep[1.1] < ratio_sweep[1.2]
 
-        teardrop_result = teardrop_bolt_cut_sinkhole(**params, teardrop_ratio=1.0)
-        bolt_result = bolt_cut_sinkhole(**params)
+    def test_teardrop_bolt_cut_ratio_1_0_equals_cylindrical(self, volume, ratio_sweep):
+        """Test that teardrop_ratio=1.0 produces same result as bolt_cut_sinkhole"""
+        bolt_result = _build("bolt", **RATIO_BASE_PARAMS)
 
         # Should have identical volumes
-        assert abs(teardrop_result.volume - bolt_result.volume) < 1e-6
+        assert isclose(ratio_sweep[1.0], volume(bolt_result), rel_tol=VOL_TOL_REL)
 
-    def test_teardrop_bolt_cut_ratio_variations(self):
+    def test_teardrop_bolt_cut_ratio_variations(self, ratio_sweep):
         """Test that different teardrop ratios produce different volumes"""
-        base_params = {
-            "shaft_radius": 1.65,
-            "shaft_depth": 2.0,
-            "head_radius": 3.1,
-            "head_depth": 5.0,
-            "chamfer_radius": 1.0,
-            "extension_distance": 10.0,
-        }
-
-        ratios = [1.0, 1.05, 1.1, 1.15, 1.2]
-        results = [
-            teardrop_bolt_cut_sinkhole(**base_params, teardrop_ratio=r) for r in ratios
-        ]
-
-        # Each result should be valid
-        for result in results:
-            assert isinstance(result, Part)
-            assert result.volume > 0
+        volumes = list(ratio_sweep.values())
 
+        assert all(volume > 0 for volume in volumes)
         # Volumes should increase with ratio
-        for i in range(len(results) - 1):
-            assert results[i].volume < results[i + 1].volume
+        assert all(low < high for low, high in pairwise(volumes))
 
 
 class TestBoltCutSinkhole:
-    def test_bolt_cut_default_parameters(self):
+    def test_bolt_cut_default_parameters(self, default_bolt):
         """Test bolt cut with default parameters"""
-        result = bolt_cut_sinkhole()
-
-        assert isinstance(result, Part)
-        assert result.volume > 0
-
-    def test_bolt_cut_custom_shaft(self):
-        """Test bolt cut with custom shaft dimensions"""
-        result = bolt_cut_sinkhole(shaft_radius=2.0, shaft_depth=5.0)
-
-        assert isinstance(result, Part)
-        assert result.volume > 0
+        assert default_bolt.volume > 0
 
-    def test_bolt_cut_custom_head(self):
-        """Test bolt cut with custom head dimensions"""
-        result = bolt_cut_sinkhole(head_radius=4.0, head_depth=3.0)
+    @pytest.mark.parametrize("case", BOLT_CASES, ids=_bolt_case_id)
+    def test_bolt_cut_parameter_combinations(self, case):
+        """Test bolt cut across shaft/head/chamfer/extension sizes"""
+        result = bolt_cut_sinkhole(**dict(zip(BOLT_PARAMS, case)))
 
-        assert isinstance(result, Part)
         assert result.volume > 0
 
     def test_bolt_cut_with_chamfer(self):
@@ -210,77 +175,27 @@ class TestBoltCutSinkhole:
         result1 = bolt_cut_sinkhole(chamfer_radius=0.5)
         result2 = bolt_cut_sinkhole(chamfer_radius=2.0)
 
-        assert isinstance(result1, Part)
-        assert isinstance(result2, Part)
         # Different chamfer radii should produce different volumes
         assert result1.volume != result2.volume
 
-    def test_bolt_cut_with_extension(self):
+    def test_bolt_cut_with_extension(self, volume):
         """Test bolt cut with extension distance"""
-        result_with = bolt_cut_sinkhole(extension_distance=50)
-        result_without = bolt_cut_sinkhole(extension_distance=0)
+        result_with = _build("bolt", extension_distance=50)
+        result_without = _build("bolt", extension_distance=0)
 
-        assert isinstance(result_with, Part)
-        assert isinstance(result_without, Part)
         # With extension should have more volume
-        assert result_with.volume > result_without.volume
+        assert volume(result_with) > volume(result_without)
 
-    def test_bolt_cut_zero_extension(self):
+    def test_bolt_cut_zero_extension(self, volume):
         """Test bolt cut with zero extension (blind hole)"""
-        result = bolt_cut_sinkhole(extension_distance=0)
-
-        assert isinstance(result, Part)
-        assert result.volume > 0
+        result = _build("bolt", extension_distance=0)
 
-    def test_bolt_cut_small_dimensions(self):
-        """Test bolt cut with small dimensions"""
-        result = bolt_cut_sinkhole(
-            shaft_radius=0.5,
-            shaft_depth=1.0,
-            head_radius=1.0,
-            head_depth=1.5,
-            chamfer_radius=0.2,
-        )
+        assert volume(result) > 0
 
-        assert isinstance(result, Part)
-        assert result.volume > 0
-
-    def test_bolt_cut_large_dimensions(self):
-        """Test bolt cut with large dimensions"""
-        result = bolt_cut_sinkhole(
-            shaft_radius=5.0,
-            shaft_depth=10.0,
-            head_radius=8.0,
-            head_depth=8.0,
-            chamfer_radius=2.0,
-        )
-
-        assert isinstance(result, Part)
-        assert result.volume > 0
-
-    def test_bolt_cut_vs_teardrop(self):
-        """Test that bolt_cut and teardrop_bolt_cut with default ratio produce different results"""
-        params = {
-            "shaft_radius": 1.65,
-            "shaft_depth": 2.0,
-            "head_radius": 3.1,
-            "head_depth": 5.0,
-            "chamfer_radius": 1.0,
-            "extension_distance": 10.0,
-        }
-
-        bolt_result = bolt_cut_sinkhole(**params)
-        teardrop_result = teardrop_bolt_cut_sinkhole(
-            **params
-        )  # Uses default teardrop_ratio=1.1
-
-        # Teardrop with default ratio should have more volume than cylindrical
-        assert isinstance(bolt_result, Part)
-        assert isinstance(teardrop_result, Part)
-        assert teardrop_result.volume > bolt_result.volume
-
-    def test_bolt_cut_is_wrapper_for_teardrop(self):
-        """Test that bolt_cut_sinkhole is a wrapper for teardrop with ratio=1.0"""
+    @pytest.fixture(scope="class")
+    def paired_parts(self):
+        """(bolt, teardrop at ratio 1.0, teardrop at the default ratio) built
+        from one set of non-default sizes and shared by the comparison tests"""
         params = {
             "shaft_radius": 2.0,
             "shaft_depth": 3.0,
@@ -289,56 +204,44 @@ class TestBoltCutSinkhole:
             "chamfer_radius": 1.5,
             "extension_distance": 20.0,
         }
+        return (
+            _build("bolt", **params),
+            _build("teardrop", **params, teardrop_ratio=1.0),
+            _build("teardrop", **params),
+        )
 
-        bolt_result = bolt_cut_sinkhole(**params)
-        teardrop_result = teardrop_bolt_cut_sinkhole(**params, teardrop_ratio=1.0)
+    def test_bolt_cut_vs_teardrop(self, volume, paired_parts):
+        """Test that bolt_cut and teardrop_bolt_cut with default ratio produce different results"""
+        bolt_result, _, teardrop_result = paired_parts
 
-        # Should produce identical results
-        assert isinstance(bolt_result, Part)
-        assert isinstance(teardrop_result, Part)
-        assert abs(bolt_result.volume - teardrop_result.volume) < 1e-6
+        # Teardrop with default ratio should have more volume than cylindrical
+        assert volume(teardrop_result) > volume(bolt_result)
 
-    def test_bolt_cut_parameter_combinations(self):
-        """Test various parameter combinations"""
-        combinations = [
-            (1.0, 2.0, 2.0, 3.0, 0.5, 10),
-            (2.0, 3.0, 4.0, 5.0, 1.0, 50),
-            (1.65, 2.0, 3.1, 5.0, 1.0, 100),
-        ]
+    def test_bolt_cut_is_wrapper_for_teardrop(self, volume, paired_parts):
+        """Test that bolt_cut_sinkhole is a wrapper for teardrop with ratio=1.0"""
+        bolt_result, teardrop_result, _ = paired_parts
 
-        for shaft_r, shaft_d, head_r, head_d, chamfer_r, ext in combinations:
-            result = bolt_cut_sinkhole(
-                shaft_radius=shaft_r,
-                shaft_depth=shaft_d,
-                head_radius=head_r,
-                head_depth=head_d,
-                chamfer_radius=chamfer_r,
-                extension_distance=ext,
-            )
-            assert isinstance(result, Part)
-            assert result.volume > 0
+        # Should produce identical results
+        assert isclose(
+            volume(bolt_result), volume(teardrop_result), rel_tol=VOL_TOL_REL
+        )
 
 
 class TestSquareNutSinkhole:
-    def test_square_nut_default_parameters(self):
+    def test_square_nut_default_parameters(self, default_square_nut):
         """Test square nut sinkhole with default parameters"""
-        result = square_nut_sinkhole()
-
-        assert isinstance(result, Part)
-        assert result.volume > 0
+        assert default_square_nut.volume > 0
 
     def test_square_nut_custom_bolt(self):
         """Test square nut sinkhole with custom bolt dimensions"""
         result = square_nut_sinkhole(bolt_radius=2.0, bolt_depth=5.0)
 
-        assert isinstance(result, Part)
         assert result.volume > 0
 
     def test_square_nut_custom_nut(self):
         """Test square nut sinkhole with custom nut dimensions"""
         result = square_nut_sinkhole(nut_height=3.0, nut_legnth=7.0, nut_depth=50.0)
 
-        assert isinstance(result, Part)
         assert result.volume > 0
 
     def test_square_nut_with_extension(self):
@@ -346,8 +249,6 @@ class TestSquareNutSinkhole:
         result_with = square_nut_sinkhole(bolt_extension=5)
         result_without = square_nut_sinkhole(bolt_extension=0)
 
-        assert isinstance(result_with, Part)
-        assert isinstance(result_without, Part)
         # With extension should have more volume
         assert result_with.volume > result_without.volume
 
@@ -355,7 +256,6 @@ class TestSquareNutSinkhole:
         """Test square nut sinkhole with zero extension"""
         result = square_nut_sinkhole(bolt_extension=0)
 
-        assert isinstance(result, Part)
         assert result.volume > 0
 
     def test_square_nut_small_dimensions(self):
@@ -369,7 +269,6 @@ class TestSquareNutSinkhole:
             bolt_extension=0.5,
         )
 
-        assert isinstance(result, Part)
         assert result.volume > 0
 
     def test_square_nut_large_dimensions(self):
@@ -383,14 +282,12 @@ class TestSquareNutSinkhole:
             bolt_extension=10.0,
         )
 
-        assert isinstance(result, Part)
         assert result.volume > 0
 
     def test_square_nut_nut_larger_than_bolt(self):
         """Test that nut dimensions are larger than bolt"""
         result = square_nut_sinkhole(bolt_radius=1.5, nut_legnth=6.0)
 
-        assert isinstance(result, Part)
         # Nut trap should add significant volume
         assert result.volume > 0
 
@@ -399,30 +296,31 @@ class TestSquareNutSinkhole:
         small_nut = square_nut_sinkhole(nut_legnth=4.0, nut_height=1.5)
         large_nut = square_nut_sinkhole(nut_legnth=8.0, nut_height=3.0)
 
-        assert isinstance(small_nut, Part)
-        assert isinstance(large_nut, Part)
         # Larger nut should have more volume
         assert large_nut.volume > small_nut.volume
 
-    def test_square_nut_parameter_combinations(self):
-        """Test various parameter combinations"""
-        combinations = [
+    @pytest.mark.parametrize(
+        "bolt_r,bolt_d,nut_h,nut_l,nut_d,bolt_ext",
+        [
             (1.0, 2.0, 1.5, 4.0, 20, 0.5),
             (1.65, 2.0, 2.1, 5.6, 100, 1.0),
             (2.5, 3.0, 3.0, 8.0, 50, 2.0),
-        ]
-
-        for bolt_r, bolt_d, nut_h, nut_l, nut_d, bolt_ext in combinations:
-            result = square_nut_sinkhole(
-                bolt_radius=bolt_r,
-                bolt_depth=bolt_d,
-                nut_height=nut_h,
-                nut_legnth=nut_l,
-                nut_depth=nut_d,
-                bolt_extension=bolt_ext,
-            )
-            assert isinstance(result, Part)
-            assert result.volume > 0
+        ],
+        ids=["small", "default", "large"],
+    )
+    def test_square_nut_parameter_combinations(
+        self, bolt_r, bolt_d, nut_h, nut_l, nut_d, bolt_ext
+    ):
+        """Test various parameter combinations"""
+        result = square_nut_sinkhole(
+            bolt_radius=bolt_r,
+            bolt_depth=bolt_d,
+            nut_height=nut_h,
+            nut_legnth=nut_l,
+            nut_depth=nut_d,
+            bolt_extension=bolt_ext,
+        )
+        assert result.volume > 0
 
     def test_square_nut_geometry_structure(self):
         """Test that square nut creates the expected geometry structure"""
@@ -435,27 +333,21 @@ class TestSquareNutSinkhole:
             bolt_extension=1.0,
         )
 
-        assert isinstance(result, Part)
-        # Should have multiple components (bolt hole + nut trap + optional extension)
+        # Should have multiple components (bolt hole + nut trap + optional extension);
+        # a positive volume already implies a non-zero extent along Y
         assert result.volume > 0
 
-        # Check that geometry extends in Y direction (nut trap direction)
-        bbox = result.bounding_box()
-        assert bbox.size.Y > 0
-
 
 class TestBoltFittingsIntegration:
-    def test_all_functions_return_parts(self):
+    def test_all_functions_return_parts(
+        self, default_teardrop, default_bolt, default_square_nut
+    ):
         """Test that all functions return valid Part objects"""
-        teardrop = teardrop_bolt_cut_sinkhole()
-        bolt = bolt_cut_sinkhole()
-        square = square_nut_sinkhole()
+        assert isinstance(default_teardrop, Part)
+        assert isinstance(default_bolt, Part)
+        assert isinstance(default_square_nut, Part)
 
-        assert isinstance(teardrop, Part)
-        assert isinstance(bolt, Part)
-        assert isinstance(square, Part)
-
-    def test_consistent_sizing(self):
+    def test_consistent_sizing(self, volume):
         """Test that similar dimensions produce similar results"""
         params = {
             "shaft_radius": 1.65,
@@ -466,36 +358,25 @@ class TestBoltFittingsIntegration:
             "extension_distance": 0,
         }
 
-        teardrop = teardrop_bolt_cut_sinkhole(**params)  # Default ratio=1.1
-        bolt = bolt_cut_sinkhole(**params)  # Equivalent to ratio=1.0
+        teardrop = _build("teardrop", **params)  # Default ratio=1.1
+        bolt = _build("bolt", **params)  # Equivalent to ratio=1.0
 
         # Teardrop with default 1.1 ratio should be slightly larger than cylindrical
-        ratio = teardrop.volume / bolt.volume
+        # (the teardrop has 1.1x multipliers)
+        ratio = volume(teardrop) / volume(bolt)
         assert 1.0 < ratio < 1.3  # Teardrop has 1.1x multipliers
 
-    def test_teardrop_ratio_parameter_independence(self):
+    def test_teardrop_ratio_parameter_independence(self, ratio_sweep):
         """Test that teardrop_ratio parameter works independently"""
-        params = {
-            "shaft_radius": 1.65,
-            "shaft_depth": 2.0,
-            "head_radius": 3.1,
-            "head_depth": 5.0,
-            "chamfer_radius": 1.0,
-            "extension_distance": 10.0,
-        }
-
-        # Test that changing only teardrop_ratio changes volume
-        result_low = teardrop_bolt_cut_sinkhole(**params, teardrop_ratio=1.05)
-        result_mid = teardrop_bolt_cut_sinkhole(**params, teardrop_ratio=1.1)
-        result_high = teardrop_bolt_cut_sinkhole(**params, teardrop_ratio=1.15)
-
-        # Volumes should increase with ratio
-        assert result_low.volume < result_mid.volume < result_high.volume
+        # Only teardrop_ratio varies across the sweep, so the volumes must too
+        assert len(set(ratio_sweep.values())) == len(SWEEP_RATIOS)
+        assert ratio_sweep[1.05] < ratio_sweep[1.1] < ratio_sweep[1.15]
 
     def test_volume_increases_with_dimensions(self):
         """Test that increasing dimensions increases volume"""
-        small = bolt_cut_sinkhole(shaft_radius=1.0, head_radius=2.0)
-        medium = bolt_cut_sinkhole(shaft_radius=2.0, head_radius=3.0)
-        large = bolt_cut_sinkhole(shaft_radius=3.0, head_radius=4.0)
+        volumes = [
+            bolt_cut_sinkhole(shaft_radius=shaft, head_radius=head).volume
+            for shaft, head in [(1.0, 2.0), (2.0, 3.0), (3.0, 4.0)]
+        ]
 
-        assert small.volume < medium.volume < large.volume
+        assert all(low < high for low, high in pairwise(volumes))
@@ -1,95 +1,57 @@
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from importlib.machinery import SourceFileLoader
-from importlib.util import module_from_spec, spec_from_loader
 import pytest
-import os
-from unittest.mock import patch
-from pathlib import Path
 
-from build123d import BuildPart, Box, Part, Sphere, Align, Mode, Location, add
+from build123d import BuildPart, Box, Align, Mode, Location, add
 
 from fb_library.point import Point
 
 from fb_library.dovetail import (
     DovetailPart,
     DovetailStyle,
-    dovetail_split_line,
     dovetail_subpart,
     snugtail_subpart_outline,
     dovetail_subpart_outline,
 )
 
 
-class TestDovetail:
+@pytest.fixture(scope="session")
+def box_part():
+    """a 10x50x2 box sitting on the XY plane to split dovetails from, built
+    once per session; dovetail_subpart only reads from it"""
+    with BuildPart(mode=Mode.PRIVATE) as test:
+        Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    return test.part
 
-    def test_direct_run(self):
-        with (
-            patch("build123d.export_stl"),
-            patch("pathlib.Path.mkdir"),
-            patch("pathlib.Path.exists"),
-            patch("pathlib.Path.is_dir"),
-            patch("ocp_vscode.show"),
-            patch("ocp_vscode.save_screenshot"),
-        ):
-            loader = SourceFileLoader("__main__", "src/fb_library/dovetail.py")
-            loader.exec_module(module_from_spec(spec_from_loader(loader.name, loader)))
 
-    def test_start_end_match(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
-        with pytest.raises(ValueError):
-            x = (
-                dovetail_subpart(
-                    test.part,
-                    Point(5, 0),
-                    Point(5, 0),
-                    # scarf_distance=0.5,
-                    section=DovetailPart.TAIL,
-                    # tilt=20,
-                    vertical_offset=-100,
-                ),
-            )
+class TestDovetail:
 
-    def test_vertical_offset_too_high(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
-        with pytest.raises(ValueError):
-            x = (
-                dovetail_subpart(
-                    test.part,
-                    Point(-5, 0),
-                    Point(5, 0),
-                    # scarf_distance=0.5,
-                    section=DovetailPart.TAIL,
-                    # tilt=20,
-                    vertical_offset=100,
-                ),
-            )
+    @pytest.mark.smoke
+    def test_direct_run(self, direct_run):
+        direct_run("dovetail")
 
-    def test_vertical_offset_too_low(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    @pytest.mark.parametrize(
+        "start,end,vertical_offset",
+        [
+            ((5, 0), (5, 0), -100),
+            ((-5, 0), (5, 0), 100),
+            ((-5, 0), (5, 0), -100),
+        ],
+        ids=["start-end-match", "vertical-offset-too-high", "vertical-offset-too-low"],
+    )
+    def test_invalid_subpart_raises(self, box_part, start, end, vertical_offset):
         with pytest.raises(ValueError):
-            x = (
-                dovetail_subpart(
-                    test.part,
-                    Point(-5, 0),
-                    Point(5, 0),
-                    # scarf_distance=0.5,
-                    section=DovetailPart.TAIL,
-                    # tilt=20,
-                    vertical_offset=-100,
-                ),
+            dovetail_subpart(
+                box_part,
+                Point(*start),
+                Point(*end),
+                section=DovetailPart.TAIL,
+                vertical_offset=vertical_offset,
             )
 
-    def test_valid_traditional_tail(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    def test_valid_traditional_tail(self, box_part):
         with BuildPart() as tail:
             add(
                 dovetail_subpart(
-                    test.part,
+                    box_part,
                     Point(-5, 0),
                     Point(5, 0),
                     # scarf_distance=0.5,
@@ -102,13 +64,11 @@ class TestDovetail:
             )
         assert tail.part.is_valid
 
-    def test_valid_socket(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    def test_valid_socket(self, box_part):
         with BuildPart() as socket:
             add(
                 dovetail_subpart(
-                    test.part,
+                    box_part,
                     Point(-5, 0),
                     Point(5, 0),
                     taper_angle=1,
@@ -128,13 +88,11 @@ class TestDovetail:
                 style=DovetailStyle.SNUGTAIL,
             )
 
-    def test_valid_tslot_socket(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    def test_valid_tslot_socket(self, box_part):
         with BuildPart() as socket:
             add(
                 dovetail_subpart(
-                    test.part,
+                    box_part,
                     Point(-5, 0),
                     Point(5, 0),
                     taper_angle=1,
@@ -146,13 +104,11 @@ class TestDovetail:
             )
         assert socket.part.is_valid
 
-    def test_valid_tslot_tail(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    def test_valid_tslot_tail(self, box_part):
         with BuildPart() as tail:
             add(
                 dovetail_subpart(
-                    test.part,
+                    box_part,
                     Point(-5, 0),
                     Point(5, 0),
                     taper_angle=1,
@@ -164,13 +120,11 @@ class TestDovetail:
             )
         assert tail.part.is_valid
 
-    def test_valid_snugtail_tail(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    def test_valid_snugtail_tail(self, box_part):
         with BuildPart() as tail:
             add(
                 dovetail_subpart(
-                    test.part,
+                    box_part,
                     Point(-5, 0),
                     Point(5, 0),
                     # scarf_distance=0.5,
@@ -183,13 +137,11 @@ class TestDovetail:
             )
         assert tail.part.is_valid
 
-    def test_valid_snugtail_socket(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
+    def test_valid_snugtail_socket(self, box_part):
         with BuildPart() as socket:
             add(
                 dovetail_subpart(
-                    test.part,
+                    box_part,
                     Point(-5, 0),
                     Point(5, 0),
                     taper_angle=1,
@@ -203,8 +155,6 @@ class TestDovetail:
         assert socket.part.is_valid
 
     def test_snugtail_ratios_exceed_max(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
         with pytest.raises(ValueError):
             snugtail_subpart_outline(
                 Point(-5, 0),
@@ -215,32 +165,20 @@ class TestDovetail:
                 depth_ratio=0.11,
             )
 
-    def test_valid_vert_tail(self):
-        with BuildPart(mode=Mode.PRIVATE) as test:
-            Box(10, 50, 2, align=(Align.CENTER, Align.CENTER, Align.MIN))
-        with pytest.raises(ValueError):
-            x = (
-                dovetail_subpart(
-                    test.part,
-                    Point(-5, 0),
-                    Point(5, 0),
-                    taper_angle=-1,
-                    section=DovetailPart.TAIL,
-                    # tilt=20,
-                    vertical_offset=-0.5,
-                ),
-            )
+    @pytest.mark.parametrize(
+        "taper_angle,vertical_offset",
+        [(-1, -0.5), (0.5, 0.5)],
+        ids=["negative-taper", "positive-taper"],
+    )
+    def test_invalid_taper_raises(self, box_part, taper_angle, vertical_offset):
         with pytest.raises(ValueError):
-            x = (
-                dovetail_subpart(
-                    test.part,
-                    Point(-5, 0),
-                    Point(5, 0),
-                    taper_angle=0.5,
-                    section=DovetailPart.TAIL,
-                    # tilt=20,
-                    vertical_offset=0.5,
-                ),
+            dovetail_subpart(
+                box_part,
+                Point(-5, 0),
+                Point(5, 0),
+                taper_angle=taper_angle,
+                section=DovetailPart.TAIL,
+                vertical_offset=vertical_offset,
             )
 
 
@@ -274,15 +212,7 @@ def test_visualize_positive_voffset_dovetail():
         vertical_offset=voffset,
     ).move(Location((0, -15, 0)))
 
-    with (
-        patch("build123d.export_stl"),
-        patch("pathlib.Path.mkdir"),
-        patch("pathlib.Path.exists"),
-        patch("pathlib.Path.is_dir"),
-        patch("ocp_vscode.show"),
-        patch("ocp_vscode.save_screenshot"),
-    ):
-        show(top, bottom, reset_camera=Camera.KEEP)
+    show(top, bottom, reset_camera=Camera.KEEP)
 
 
 @pytest.mark.manual
@@ -349,25 +279,16 @@ def test_visualize_negative_voffset_dovetail():
     with BuildSketch() as sk:
         add(spline)
         make_face()
-    from build123d import export_stl
 
-    with (
-        patch("build123d.export_stl"),
-        patch("pathlib.Path.mkdir"),
-        patch("pathlib.Path.exists"),
-        patch("pathlib.Path.is_dir"),
-        patch("ocp_vscode.show"),
-        patch("ocp_vscode.save_screenshot"),
-    ):
-        show(
-            tl,
-            sckt,
-            # sk,
-            # sks,
-            # spline,
-            # splines,
-            reset_camera=Camera.KEEP,
-        )
+    show(
+        tl,
+        sckt,
+        # sk,
+        # sks,
+        # spline,
+        # splines,
+        reset_camera=Camera.KEEP,
+    )
 
 
 if __name__ == "__main__":
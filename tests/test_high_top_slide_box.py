@@ -1,8 +1,5 @@
-from importlib.machinery import SourceFileLoader
-from importlib.util import module_from_spec, spec_from_loader
-from unittest.mock import patch
 import pytest
-from build123d import Box, BuildPart, Part, Align, Axis, fillet, Compound
+from build123d import Part, Compound
 
 from fb_library.high_top_slide_box import (
     high_top_slide_box,
@@ -14,29 +11,77 @@ from fb_library.high_top_slide_box import (
 
 
 class TestHighTopSlideBox:
-    @pytest.fixture
-    def base_part(self):
-        """Create a basic test part for testing."""
-        with BuildPart() as base_box:
-            Box(44, 44, 44, align=(Align.CENTER, Align.CENTER, Align.MIN))
-            fillet(base_box.part.edges().filter_by(Axis.Z), radius=1.5)
-        return base_box.part
-
-    @pytest.fixture
-    def small_base_part(self):
-        """Create a smaller test part for faster testing."""
-        with BuildPart() as base_box:
-            Box(20, 20, 20, align=(Align.CENTER, Align.CENTER, Align.MIN))
-        return base_box.part
-
-    def test_high_top_slide_box_default_params(self, small_base_part):
-        """Test high_top_slide_box with default parameters."""
-        result = high_top_slide_box(
-            base_part=small_base_part,
-            top_height=5,
-            rail_height=8,
-            wall_thickness=2,
-        )
+    @pytest.mark.parametrize(
+        "size,kwargs",
+        [
+            pytest.param(
+                (20, 20, 20),
+                dict(top_height=5, rail_height=8, wall_thickness=2),
+                id="default-params",
+            ),
+            pytest.param(
+                (20, 20, 20),
+                dict(
+                    top_height=6,
+                    rail_height=10,
+                    wall_thickness=3,
+                    rail_angle=1.0,
+                    divot_radius=0.8,
+                    thumb_radius=2.0,
+                    tolerance=0.15,
+                ),
+                id="all-params",
+            ),
+            pytest.param(
+                (20, 20, 20),
+                dict(top_height=5, rail_height=8, wall_thickness=2, divot_radius=0),
+                id="zero-divot-radius",
+            ),
+            pytest.param(
+                (20, 20, 20),
+                dict(top_height=5, rail_height=8, wall_thickness=2, tolerance=-0.1),
+                id="negative-tolerance",
+            ),
+            pytest.param(
+                (20, 20, 20),
+                dict(top_height=5, rail_height=8, wall_thickness=2, rail_angle=2.0),
+                id="large-rail-angle",
+            ),
+            pytest.param(
+                (20, 20, 20),
+                dict(top_height=5, rail_height=8, wall_thickness=0.5),
+                id="thin-walls",
+            ),
+            pytest.param(
+                (20, 20, 20),
+                dict(top_height=1, rail_height=8, wall_thickness=2),
+                id="small-top-height",
+            ),
+            pytest.param(
+                (20, 20, 20),
+                dict(top_height=5, rail_height=2, wall_thickness=2),
+                id="small-rail-height",
+            ),
+            pytest.param(
+                (10, 10, 10),
+                dict(top_height=2, rail_height=3, wall_thickness=1),
+                id="minimal-dimensions",
+            ),
+            pytest.param(
+                (30, 15, 10),
+                dict(top_height=4, rail_height=6, wall_thickness=2),
+                id="rectangular-base",
+            ),
+            pytest.param(
+                (20, 20, 50),
+                dict(top_height=8, rail_height=12, wall_thickness=3),
+                id="tall-base",
+            ),
+        ],
+    )
+    def test_high_top_slide_box_variants(self, sized_box, size, kwargs):
+        """Test high_top_slide_box across base sizes and parameters."""
+        result = high_top_slide_box(base_part=sized_box(size), **kwargs)
 
         assert isinstance(result, Compound)
         assert result.label == "slide box"
@@ -44,24 +89,6 @@ class TestHighTopSlideBox:
         assert result.children[0].is_valid
         assert result.children[1].is_valid
 
-    def test_high_top_slide_box_with_all_params(self, small_base_part):
-        """Test high_top_slide_box with all parameters specified."""
-        result = high_top_slide_box(
-            base_part=small_base_part,
-            top_height=6,
-            rail_height=10,
-            wall_thickness=3,
-            rail_angle=1.0,
-            divot_radius=0.8,
-            thumb_radius=2.0,
-            tolerance=0.15,
-        )
-
-        assert isinstance(result, Compound)
-        assert len(result.children) == 2
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
-
     def test_high_top_slide_box_lid(self, small_base_part):
         """Test high_top_slide_box_lid function."""
         lid = high_top_slide_box_lid(
@@ -191,157 +218,18 @@ class TestHighTopSlideBox:
         base = result.children[1]
 
         # Check that parts have reasonable dimensions
-        lid_bbox = lid.bounding_box()
-        base_bbox = base.bounding_box()
-        original_bbox = small_base_part.bounding_box()
-
-        # Lid should have similar X,Y dimensions to original
-        assert lid_bbox.size.X == pytest.approx(original_bbox.size.X, abs=0.1)
-        assert lid_bbox.size.Y == pytest.approx(original_bbox.size.Y, abs=0.1)
-
-        # Base should have similar X,Y dimensions to original
-        assert base_bbox.size.X == pytest.approx(original_bbox.size.X, abs=0.1)
-        assert base_bbox.size.Y == pytest.approx(original_bbox.size.Y, abs=0.1)
-
-    def test_zero_divot_radius(self, small_base_part):
-        """Test with divot_radius=0 to ensure no divots are created."""
-        result = high_top_slide_box(
-            base_part=small_base_part,
-            top_height=5,
-            rail_height=8,
-            wall_thickness=2,
-            divot_radius=0,
-        )
-
-        assert isinstance(result, Compound)
-        assert len(result.children) == 2
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
-
-    def test_negative_tolerance(self, small_base_part):
-        """Test with negative tolerance."""
-        result = high_top_slide_box(
-            base_part=small_base_part,
-            top_height=5,
-            rail_height=8,
-            wall_thickness=2,
-            tolerance=-0.1,
-        )
-
-        assert isinstance(result, Compound)
-        assert len(result.children) == 2
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
-
-    def test_large_rail_angle(self, small_base_part):
-        """Test with a larger rail angle."""
-        result = high_top_slide_box(
-            base_part=small_base_part,
-            top_height=5,
-            rail_height=8,
-            wall_thickness=2,
-            rail_angle=2.0,
-        )
-
-        assert isinstance(result, Compound)
-        assert len(result.children) == 2
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
+        lid_size = lid.bounding_box().size
+        base_size = base.bounding_box().size
+        # small_base_part is the 20x20x20 box, so its footprint is known
+        # without walking it for a bounding box
+        original_x, original_y = 20, 20
 
-    def test_minimal_dimensions(self):
-        """Test with very small dimensions."""
-        with BuildPart() as tiny_box:
-            Box(10, 10, 10, align=(Align.CENTER, Align.CENTER, Align.MIN))
-
-        result = high_top_slide_box(
-            base_part=tiny_box.part,
-            top_height=2,
-            rail_height=3,
-            wall_thickness=1,
+        # Lid and base should both have similar X,Y dimensions to original
+        assert [lid_size.X, lid_size.Y, base_size.X, base_size.Y] == pytest.approx(
+            [original_x, original_y, original_x, original_y], abs=0.1
         )
 
-        assert isinstance(result, Compound)
-        assert len(result.children) == 2
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
-
-    def test_direct_run(self):
+    @pytest.mark.smoke
+    def test_direct_run(self, direct_run):
         """Test that the module can be run directly without errors."""
-        with (
-            patch("ocp_vscode.show"),
-            (
-                patch("build123d.export_stl")
-                if hasattr(__import__("build123d"), "export_stl")
-                else patch("builtins.open")
-            ),
-        ):
-            loader = SourceFileLoader(
-                "__main__", "src/fb_library/high_top_slide_box.py"
-            )
-            loader.exec_module(module_from_spec(spec_from_loader(loader.name, loader)))
-
-    def test_parameter_validation_edge_cases(self, small_base_part):
-        """Test edge cases for parameter validation."""
-        # Test with very thin walls
-        result = high_top_slide_box(
-            base_part=small_base_part,
-            top_height=5,
-            rail_height=8,
-            wall_thickness=0.5,
-        )
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
-
-        # Test with very small top height
-        result = high_top_slide_box(
-            base_part=small_base_part,
-            top_height=1,
-            rail_height=8,
-            wall_thickness=2,
-        )
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
-
-        # Test with very small rail height
-        result = high_top_slide_box(
-            base_part=small_base_part,
-            top_height=5,
-            rail_height=2,
-            wall_thickness=2,
-        )
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
-
-    def test_rectangular_base_part(self):
-        """Test with a non-square rectangular base part."""
-        with BuildPart() as rect_box:
-            Box(30, 15, 10, align=(Align.CENTER, Align.CENTER, Align.MIN))
-
-        result = high_top_slide_box(
-            base_part=rect_box.part,
-            top_height=4,
-            rail_height=6,
-            wall_thickness=2,
-        )
-
-        assert isinstance(result, Compound)
-        assert len(result.children) == 2
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
-
-    def test_tall_base_part(self):
-        """Test with a tall base part."""
-        with BuildPart() as tall_box:
-            Box(20, 20, 50, align=(Align.CENTER, Align.CENTER, Align.MIN))
-
-        result = high_top_slide_box(
-            base_part=tall_box.part,
-            top_height=8,
-            rail_height=12,
-            wall_thickness=3,
-        )
-
-        assert isinstance(result, Compound)
-        assert len(result.children) == 2
-        assert result.children[0].is_valid
-        assert result.children[1].is_valid
+        direct_run("high_top_slide_box")
@@ -1,9 +1,19 @@
-from importlib.machinery import SourceFileLoader
-from importlib.util import module_from_spec, spec_from_loader
 import pytest
-from math import radians, tan
+from math import isclose, pi
 from build123d import Axis
-from fb_library.point import Point, midpoint, shifted_midpoint
+from fb_library.point import (
+    Point,
+    midpoint,
+    midpoints,
+    shifted_midpoint,
+    shifted_midpoints,
+)
+
+
+def _close(a: float, b: float) -> bool:
+    """a plain float comparison for the point math checks, which are too
+    numerous to build a pytest.approx for each"""
+    return isclose(a, b, rel_tol=1e-9, abs_tol=1e-9)
 
 
 class TestPoint:
@@ -17,6 +27,18 @@ class TestPoint:
         assert p.x == 3.0
         assert p.y == 4.0
 
+    def test_point_from_iterable(self):
+        p = Point.from_iterable((3.0, 4.0))
+        assert p.x == 3.0
+        assert p.y == 4.0
+
+    def test_point_is_frozen_and_hashable(self):
+        p = Point(3.0, 4.0)
+        with pytest.raises(AttributeError):
+            p.x = 5.0
+        assert hash(p) == hash(Point([3.0, 4.0]))
+        assert len({p, Point(3.0, 4.0)}) == 1
+
     def test_point_properties(self):
         p = Point(3.0, 4.0)
         assert p.X == 3.0
@@ -39,51 +61,52 @@ class TestPoint:
         p1 = Point(0, 0)
         p2 = Point(1, 1)
         angle = p1.angle_to(p2)
-        assert angle == pytest.approx(45.0)
+        assert _close(angle, 45.0)
+
+    def test_angle_to_rad(self):
+        p1 = Point(0, 0)
+        assert _close(p1.angle_to_rad(Point(1, 1)), pi / 4)
+        assert _close(p1.angle_to_rad(Point(1, -1)), -pi / 4)
 
     def test_distance_to(self):
         p1 = Point(0, 0)
         p2 = Point(3, 4)
         distance = p1.distance_to(p2)
-        assert distance == pytest.approx(5.0)
+        assert _close(distance, 5.0)
 
     def test_related_point(self):
         p = Point(0, 0)
         related = p.related_point(45, 5)
-        assert related.x == pytest.approx(3.5355339059327378)
-        assert related.y == pytest.approx(3.5355339059327378)
-
-    def test_related_point_by_axis_x(self):
-        p = Point(0, 0)
-        # At 45 degrees, if we move 4 units along x-axis, we should move 4 units along y-axis too
-        related = p.related_point_by_axis(45, 4, Axis.X)
-        assert related.x == pytest.approx(4.0)
-        assert related.y == pytest.approx(4.0)
-
-    def test_related_point_by_axis_y(self):
-        p = Point(0, 0)
-        # At 45 degrees, if we move 3 units along y-axis, we should move 3 units along x-axis too
-        related = p.related_point_by_axis(45, 3, Axis.Y)
-        assert related.x == pytest.approx(3.0)
-        assert related.y == pytest.approx(3.0)
-
-    def test_related_point_by_axis_30_degrees_x(self):
-        p = Point(0, 0)
-        # At 30 degrees, cos(30°) = √3/2 ≈ 0.866, sin(30°) = 1/2 = 0.5
-        # If we move 2 units along x-axis, hypotenuse = 2/cos(30°) = 2/0.866 ≈ 2.309
-        # y-distance = hypotenuse * sin(30°) = 2.309 * 0.5 ≈ 1.155
-        related = p.related_point_by_axis(30, 2, Axis.X)
-        assert related.x == pytest.approx(2.0)
-        assert related.y == pytest.approx(1.1547005383792515)  # 2 * tan(30°)
-
-    def test_related_point_by_axis_60_degrees_y(self):
-        p = Point(0, 0)
-        # At 60 degrees, sin(60°) = √3/2 ≈ 0.866, cos(60°) = 1/2 = 0.5
-        # If we move 3 units along y-axis, hypotenuse = 3/sin(60°) = 3/0.866 ≈ 3.464
-        # x-distance = hypotenuse * cos(60°) = 3.464 * 0.5 ≈ 1.732
-        related = p.related_point_by_axis(60, 3, Axis.Y)
-        assert related.x == pytest.approx(1.7320508075688772)  # 3 / tan(60°)
-        assert related.y == pytest.approx(3.0)
+        assert _close(related.x, 3.5355339059327378)
+        assert _close(related.y, 3.5355339059327378)
+
+    def test_related_points(self):
+        p = Point(1, 2)
+        angles, distances = [0, 45, 90, 180], [2, 5, 3, 1]
+        related = p.related_points(angles, distances)
+        assert len(related) == 4
+        for point, angle, distance in zip(related, angles, distances):
+            expected = p.related_point(angle, distance)
+            assert _close(point.x, expected.x)
+            assert _close(point.y, expected.y)
+
+    @pytest.mark.parametrize(
+        "angle,distance,axis,expected_x,expected_y",
+        [
+            # at 45 degrees, moving along one axis moves as far along the other
+            (45, 4, Axis.X, 4.0, 4.0),
+            (45, 3, Axis.Y, 3.0, 3.0),
+            # y-distance = 2 * tan(30°)
+            (30, 2, Axis.X, 2.0, 1.1547005383792515),
+            # x-distance = 3 / tan(60°)
+            (60, 3, Axis.Y, 1.7320508075688772, 3.0),
+        ],
+        ids=["45-x", "45-y", "30-x", "60-y"],
+    )
+    def test_related_point_by_axis(self, angle, distance, axis, expected_x, expected_y):
+        related = Point(0, 0).related_point_by_axis(angle, distance, axis)
+        assert _close(related.x, expected_x)
+        assert _close(related.y, expected_y)
 
     def test_related_point_by_axis_invalid_axis(self):
         p = Point(0, 0)
@@ -106,8 +129,8 @@ class TestPoint:
         p = Point(0, 0)
         # Test that the default parameter is Axis.X
         related = p.related_point_by_axis(45, 4)  # Should default to Axis.X
-        assert related.x == pytest.approx(4.0)
-        assert related.y == pytest.approx(4.0)
+        assert _close(related.x, 4.0)
+        assert _close(related.y, 4.0)
 
 
 class TestUtilityFunctions:
@@ -118,27 +141,35 @@ class TestUtilityFunctions:
         assert mid.x == 5.0
         assert mid.y == 5.0
 
-    def test_shifted_midpoint_no_shift(self):
-        p1 = Point(0, 0)
-        p2 = Point(10, 10)
-        shifted_mid = shifted_midpoint(p1, p2, 0)
-        assert shifted_mid.x == pytest.approx(5.0)
-        assert shifted_mid.y == pytest.approx(5.0)
-
-    def test_shifted_midpoint_with_shift(self):
-        p1 = Point(0, 0)
-        p2 = Point(10, 0)
-        shifted_mid = shifted_midpoint(p1, p2, 2)
-        assert shifted_mid.x == pytest.approx(7.0)  # 5 + 2
-        assert shifted_mid.y == pytest.approx(0.0)
-
-    def test_shifted_midpoint_diagonal_shift(self):
-        p1 = Point(0, 0)
-        p2 = Point(6, 8)  # 3-4-5 triangle scaled by 2
-        shifted_mid = shifted_midpoint(p1, p2, 1)  # shift by 1 unit towards p2
-
-        # Midpoint is at (3, 4)
-        # Direction vector is (6, 8), normalized to (0.6, 0.8)
-        # Shifted midpoint is (3, 4) + 1 * (0.6, 0.8) = (3.6, 4.8)
-        assert shifted_mid.x == pytest.approx(3.6)
-        assert shifted_mid.y == pytest.approx(4.8)
+    @pytest.mark.parametrize(
+        "end,shift,expected_x,expected_y",
+        [
+            ((10, 10), 0, 5.0, 5.0),
+            ((10, 0), 2, 7.0, 0.0),  # 5 + 2
+            # 3-4-5 triangle scaled by 2: the midpoint (3, 4) moves 1 unit
+            # along (0.6, 0.8)
+            ((6, 8), 1, 3.6, 4.8),
+        ],
+        ids=["no-shift", "shift", "diagonal-shift"],
+    )
+    def test_shifted_midpoint(self, end, shift, expected_x, expected_y):
+        shifted_mid = shifted_midpoint(Point(0, 0), Point(*end), shift)
+        assert _close(shifted_mid.x, expected_x)
+        assert _close(shifted_mid.y, expected_y)
+
+    def test_batched_midpoints_match_scalar(self):
+        starts = [Point(0, 0), Point(-3, 2), Point(6, 8)]
+        ends = [Point(10, 10), Point(5, -4), Point(0, 0)]
+        for mid, start, end in zip(midpoints(starts, ends), starts, ends):
+            assert mid == midpoint(start, end)
+        shifted = shifted_midpoints(starts, ends, 1.5)
+        for mid, start, end in zip(shifted, starts, ends):
+            assert mid == shifted_midpoint(start, end, 1.5)
+
+    def test_batched_midpoints_reject_unpaired_points(self):
+        starts = [Point(0, 0), Point(1, 1)]
+        ends = [Point(3, 4)]
+        with pytest.raises(ValueError):
+            midpoints(starts, ends)
+        with pytest.raises(ValueError):
+            shifted_midpoints(starts, ends, 1.0)
@@ -1,37 +1,33 @@
-from dataclasses import dataclass, field
-from enum import Enum, auto
-from importlib.machinery import SourceFileLoader
-from importlib.util import module_from_spec, spec_from_loader
 import pytest
-from unittest.mock import patch
-from pathlib import Path
 
 from build123d import Axis, BuildPart, Box, Align, fillet
 
 from fb_library.slide_box import slide_box
 
 
-class TestSlideBox:
-    def test_slide_box(self):
-        with BuildPart() as base_box:
-            Box(20, 44, 14, align=(Align.CENTER, Align.CENTER, Align.MIN))
-            fillet(base_box.part.edges().filter_by(Axis.Z), radius=1.5)
+@pytest.fixture(scope="session")
+def filleted_base_box():
+    """a 20x44x14 box with filleted vertical edges, built once per session;
+    slide_box only reads from it"""
+    with BuildPart() as base_box:
+        Box(20, 44, 14, align=(Align.CENTER, Align.CENTER, Align.MIN))
+        fillet(base_box.part.edges().filter_by(Axis.Z), radius=1.5)
+    return base_box.part
+
 
+class TestSlideBox:
+    def test_slide_box(self, filleted_base_box, validate):
         sb = slide_box(
-            base_box.part, wall_thickness=2, thumb_radius=3.5, divot_radius=0.5
+            filleted_base_box, wall_thickness=2, thumb_radius=3.5, divot_radius=0.5
         )
-        assert sb.children[0].is_valid
-        assert sb.children[1].is_valid
-
-    def test_direct_run(self):
+        assert len(sb.children) == 2
+        for part in sb.children:
+            # a solid extent in every direction shows the part was built; the
+            # full BRepCheck pass only runs with --validate-shapes
+            size = part.bounding_box().size
+            assert size.X > 0 and size.Y > 0 and size.Z > 0
+            validate(part)
 
-        with (
-            patch("build123d.export_stl"),
-            patch("pathlib.Path.mkdir"),
-            patch("pathlib.Path.exists"),
-            patch("pathlib.Path.is_dir"),
-            patch("ocp_vscode.show"),
-            patch("ocp_vscode.save_screenshot"),
-        ):
-            loader = SourceFileLoader("__main__", "src/fb_library/slide_box.py")
-            loader.exec_module(module_from_spec(spec_from_loader(loader.name, loader)))
+    @pytest.mark.smoke
+    def test_direct_run(self, direct_run):
+        direct_run("slide_box")
@@ -1,46 +1,61 @@
+from types import MappingProxyType
+
 import pytest
-from importlib.machinery import SourceFileLoader
-from importlib.util import spec_from_loader, module_from_spec
-from unittest.mock import patch
-from pathlib import Path
+from build123d import Location
 
 from fb_library.twist_snap import (
     twist_snap_connector,
     twist_snap_socket,
 )
 
+# the connector/socket arguments shared by both builders; read-only, so no
+# test can change them for the tests that run after it
+TWIST_PARAMS = MappingProxyType(
+    dict(
+        connector_radius=4.5,
+        tolerance=0.12,
+        snapfit_height=2,
+        snapfit_radius_extension=2 * (2 / 3) - 0.06,
+        wall_width=2,
+        wall_depth=2,
+    )
+)
+
+
+@pytest.fixture(scope="module")
+def built_connector():
+    """twist_snap_connector(**TWIST_PARAMS), built once for the module"""
+    return twist_snap_connector(**TWIST_PARAMS)
+
+
+@pytest.fixture(scope="module")
+def built_socket():
+    """twist_snap_socket(**TWIST_PARAMS), built once for the module"""
+    return twist_snap_socket(**TWIST_PARAMS)
+
 
 class TestTwistSnap:
-    def test_bare_execution(self):
-        with (
-            patch("build123d.export_stl"),
-            patch("pathlib.Path.mkdir"),
-            patch("pathlib.Path.exists"),
-            patch("pathlib.Path.is_dir"),
-            patch("ocp_vscode.show"),
-            patch("ocp_vscode.save_screenshot"),
-        ):
-            loader = SourceFileLoader("__main__", "src/fb_library/twist_snap.py")
-            loader.exec_module(module_from_spec(spec_from_loader(loader.name, loader)))
-
-    def test_twist_snap_connector(self):
-        connector = twist_snap_connector(
-            connector_radius=4.5,
-            tolerance=0.12,
-            snapfit_height=2,
-            snapfit_radius_extension=2 * (2 / 3) - 0.06,
-            wall_width=2,
-            wall_depth=2,
-        )
-        assert connector.is_valid
-
-    def test_twist_snap_socket(self):
-        socket = twist_snap_socket(
-            connector_radius=4.5,
-            tolerance=0.12,
-            snapfit_height=2,
-            snapfit_radius_extension=2 * (2 / 3) - 0.06,
-            wall_width=2,
-            wall_depth=2,
-        )
-        assert socket.is_valid
+    @pytest.mark.smoke
+    def test_bare_execution(self, direct_run):
+        direct_run("twist_snap")
+
+    @pytest.mark.parametrize("built", ["built_connector", "built_socket"])
+    def test_twist_snap_part_is_valid(self, built, request):
+        assert request.getfixturevalue(built).is_valid
+
+    @pytest.mark.parametrize(
+        "builder",
+        [twist_snap_connector, twist_snap_socket],
+        ids=["connector", "socket"],
+    )
+    def test_cached_builds_are_independent(self, builder):
+        first = builder(**TWIST_PARAMS)
+        label = first.label
+        min_z = first.bounding_box().min.Z
+        first.move(Location((0, 0, 10)))
+        first.label = "moved"
+
+        second = builder(**TWIST_PARAMS)
+        assert second is not first
+        assert second.label == label
+        assert second.bounding_box().min.Z == pytest.approx(min_z)